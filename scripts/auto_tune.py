@@ -8,8 +8,8 @@ while frames are sampled periodically — no jerky start-stop cycles.
 Algorithm:
     1. Slam to one extreme (full left, continuous 10s)
     2. Start moving continuously in the opposite direction
-    3. Sample frames every ~0.5s and compute phase correlation shift
-    4. When shift drops to noise for 3 consecutive samples, camera hit limit
+    3. Sample frames every ~0.5s and compute a frame-difference motion metric
+    4. When the smoothed metric drops to noise, the camera hit the limit
     5. Record total travel time; center = half of total
     6. Capture photos at extremes, corners, and center
 
@@ -27,6 +27,8 @@ import json
 import os
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "python"))
 
@@ -49,12 +51,15 @@ from bcc950.constants import (
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
 # Tuning parameters
-SAMPLE_INTERVAL = 0.5     # seconds between frame samples during continuous movement
-SHIFT_THRESHOLD = 3.0     # phase correlation shift (pixels) below this = stopped
-CONSECUTIVE_STOPS = 3     # consecutive below-threshold samples to confirm limit
+SAMPLE_INTERVAL = 0.25    # seconds between frame samples during continuous movement
+VEL_THRESHOLD = 6.0       # shift velocity (px/s) below this = stopped
+DIFF_THRESHOLD = 2.0      # mean absdiff (gray levels) below this = stopped
+SMOOTH_WINDOW = 4         # samples in the sliding mean of the motion metric
+CONSECUTIVE_STOPS = 1     # consecutive below-threshold (smoothed) samples to confirm limit
 SLAM_DURATION = 10.0      # seconds to drive hard into a limit
 WARMUP_FRAMES = 10        # frames to discard for auto-exposure
 SETTLE_TIME = 0.5         # seconds to let camera settle after stopping
+ROI_SIZE = 256            # center-crop side length for shift detection
 
 
 def capture_frame(cap: cv2.VideoCapture) -> np.ndarray:
@@ -68,35 +73,146 @@ def capture_frame(cap: cv2.VideoCapture) -> np.ndarray:
     return frame
 
 
-def capture_gray(cap: cv2.VideoCapture) -> np.ndarray:
-    """Capture a grayscale frame."""
-    return cv2.cvtColor(capture_frame(cap), cv2.COLOR_BGR2GRAY)
+def make_frame_clock(cap: cv2.VideoCapture):
+    """Pick a timestamp source for one sweep; returns a zero-arg callable.
+
+    Prefers the driver's frame timestamp (CAP_PROP_POS_MSEC), which is
+    immune to the up-to-one-frame-interval jitter cap.read() adds while
+    waiting for a fresh buffer.  The probe runs once: a sweep must stay
+    on a single clock base, because mixing POS_MSEC and time.monotonic()
+    readings makes the inter-frame dt meaningless whenever one frame
+    happens to lack a driver timestamp.  Probe after at least one frame
+    has been read, or POS_MSEC reports 0 even on capable backends.
+    """
+    if cap.get(cv2.CAP_PROP_POS_MSEC) > 0:
+        return lambda: cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+    return time.monotonic
+
+
+def capture_gray(cap: cv2.VideoCapture, clock=time.monotonic) -> tuple[np.ndarray, float]:
+    """Capture a single-channel frame and its timestamp per *clock*.
+
+    Uses the green channel rather than a weighted BGR2GRAY conversion:
+    shift detection only needs one channel, extractChannel is a strided
+    copy with no per-pixel arithmetic, and green carries the strongest
+    signal on a Bayer sensor.
+    """
+    gray = cv2.extractChannel(capture_frame(cap), 1)
+    return gray, clock()
+
+
+# JPEG encode+write blocks 50-200ms of CPU per photo; doing it on a
+# background thread lets it overlap the next mechanical slam/settle.
+_photo_executor = ThreadPoolExecutor(max_workers=2)
 
 
 def save_photo(cap: cv2.VideoCapture, path: str, label: str) -> None:
-    """Capture and save a photo."""
+    """Capture a photo and write it to disk on a background thread.
+
+    run_auto_tune drains the executor before writing the calibration,
+    so all photos are on disk by the time the script exits.
+    """
     time.sleep(SETTLE_TIME)
     frame = capture_frame(cap)
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    cv2.imwrite(path, frame)
+    _photo_executor.submit(cv2.imwrite, path, frame)
     print(f"  Photo saved: {label} -> {os.path.relpath(path, PROJECT_ROOT)}")
 
 
-def phase_shift(prev_gray: np.ndarray, curr_gray: np.ndarray, axis: str) -> float:
-    """Estimate global camera shift between two frames using phase correlation.
+_WINDOW_CACHE: dict[tuple[int, int], np.ndarray] = {}
 
-    Returns shift in pixels along the axis ('pan' = horizontal, 'tilt' = vertical).
-    """
-    prev_f = prev_gray.astype(np.float64)
-    curr_f = curr_gray.astype(np.float64)
 
-    h, w = prev_gray.shape
-    window = np.outer(np.hanning(h), np.hanning(w))
-    prev_f *= window
-    curr_f *= window
+def _hanning_window(h: int, w: int) -> np.ndarray:
+    """Cached 2-D float32 Hanning window, shared module-wide.
 
-    (dx, dy), response = cv2.phaseCorrelate(prev_f, curr_f)
-    return abs(dx) if axis == "pan" else abs(dy)
+    cv2.createHanningWindow builds the window in optimized C (far
+    faster than a NumPy outer product), and caching by shape means the
+    window is computed once per process no matter how many detectors
+    or sweeps use it.  The cached array is read-only.
+    """
+    win = _WINDOW_CACHE.get((h, w))
+    if win is None:
+        win = cv2.createHanningWindow((w, h), cv2.CV_32F)
+        win.flags.writeable = False
+        _WINDOW_CACHE[(h, w)] = win
+    return win
+
+
+class MotionDetector:
+    """Phase-correlation shift detector with preallocated buffers.
+
+    The naive per-sample path converts both frames to float64 and
+    rebuilds an H*W Hanning window every call -- several MB allocated
+    and freed twice a second.  This class hoists the window and two
+    float32 frame buffers into instance state so each sample runs
+    allocation-free, and float32 halves the memory traffic vs float64.
+
+    Correlation runs on a center crop (ROI_SIZE square) rather than the
+    full frame: a global shift is measurable from any textured region,
+    and shrinking 720p input to 256x256 cuts the FFT cost ~10x.
+    """
+
+    def __init__(self, h: int, w: int, axis: str):
+        self.axis = axis
+        rh, rw = min(ROI_SIZE, h), min(ROI_SIZE, w)
+        y0, x0 = (h - rh) // 2, (w - rw) // 2
+        self._roi = (slice(y0, y0 + rh), slice(x0, x0 + rw))
+        self._window = _hanning_window(rh, rw)
+        self._curr = np.empty((rh, rw), np.float32)
+        self._spec: np.ndarray | None = None
+        self._raw_prev = np.empty((rh, rw), np.uint8)
+        self._diff = np.empty((rh, rw), np.uint8)
+        self._have_raw = False
+
+    def step(self, gray: np.ndarray) -> float:
+        """Record a new frame; return abs shift (pixels) vs the previous one.
+
+        Shift is measured along the configured axis ('pan' = horizontal,
+        'tilt' = vertical).  The first call primes the detector and
+        returns 0.0.
+
+        A cheap absdiff prefilter runs first: if the frame is nearly
+        identical to the previous one the shift is guaranteed below
+        threshold, so the window multiply and both FFTs are skipped.
+        """
+        roi = gray[self._roi]
+        if self._have_raw:
+            cv2.absdiff(roi, self._raw_prev, dst=self._diff)
+            np.copyto(self._raw_prev, roi)
+            if float(self._diff.mean()) < DIFF_THRESHOLD:
+                return 0.0
+        else:
+            np.copyto(self._raw_prev, roi)
+            self._have_raw = True
+        np.multiply(roi, self._window, out=self._curr)
+        spec = np.fft.rfft2(self._curr)
+        if self._spec is None:
+            self._spec = spec
+            return 0.0
+        dx, dy = self._phase_correlate(self._spec, spec)
+        self._spec = spec
+        return abs(dx) if self.axis == "pan" else abs(dy)
+
+    def _phase_correlate(self, a: np.ndarray, b: np.ndarray) -> tuple[float, float]:
+        """Phase correlation from two cached rfft2 spectra.
+
+        Grayscale frames are real-valued, so a real-input FFT computes
+        only the unique half of the spectrum -- half the arithmetic and
+        memory of the complex-to-complex DFT cv2.phaseCorrelate uses.
+        Each step() forward-transforms only the new frame and reuses the
+        previous frame's spectrum.  The integer peak is accurate enough
+        for the velocity comparison against VEL_THRESHOLD.
+        """
+        r = b * np.conj(a)
+        mag = np.abs(r)  # float32; the whole pipeline stays single precision
+        np.maximum(mag, 1e-10, out=mag)
+        r /= mag  # cross-power spectrum
+        corr = np.fft.irfft2(r, s=self._curr.shape)
+        peak_y, peak_x = np.unravel_index(np.argmax(corr), corr.shape)
+        h, w = corr.shape
+        dy = peak_y if peak_y <= h // 2 else peak_y - h
+        dx = peak_x if peak_x <= w // 2 else peak_x - w
+        return float(dx), float(dy)
 
 
 def set_speed(cam: BCC950Controller, control: str, value: int) -> None:
@@ -104,11 +220,29 @@ def set_speed(cam: BCC950Controller, control: str, value: int) -> None:
     cam._backend.set_control(cam.device, control, value)
 
 
-def slam_to_limit(cam: BCC950Controller, control: str, speed: int, label: str) -> None:
-    """Drive continuously into a mechanical limit."""
+def slam_to_limit(
+    cam: BCC950Controller,
+    control: str,
+    speed: int,
+    label: str,
+    warmup_cap: cv2.VideoCapture | None = None,
+) -> None:
+    """Drive continuously into a mechanical limit.
+
+    When *warmup_cap* is given, warmup frames are read and discarded
+    while the motor runs, overlapping auto-exposure settling with the
+    mechanical slam instead of spending idle wall-clock before any
+    motion starts.
+    """
     print(f"  Slamming to {label} limit ({SLAM_DURATION}s)...")
     set_speed(cam, control, speed)
-    time.sleep(SLAM_DURATION)
+    t0 = time.monotonic()
+    if warmup_cap is not None:
+        for _ in range(WARMUP_FRAMES):
+            warmup_cap.read()
+    remaining = SLAM_DURATION - (time.monotonic() - t0)
+    if remaining > 0:
+        time.sleep(remaining)
     set_speed(cam, control, 0)
     time.sleep(SETTLE_TIME)
 
@@ -120,16 +254,19 @@ def measure_continuous_sweep(
     speed: int,
     axis: str,
     label: str,
-) -> float:
+) -> tuple[float, float]:
     """Start continuous movement and sample frames until camera stops.
 
     The motor runs the entire time. We just capture frames periodically
-    and check phase correlation to detect when movement has ceased.
+    and measure the per-sample pixel shift to detect when movement has
+    ceased.  Static samples cost only the absdiff prefilter in
+    MotionDetector.step, so the stop-confirmation tail stays cheap.
 
-    Returns total travel time in seconds.
+    Returns (travel seconds, travel pixels).
     """
     print(f"  Sweeping {label} (continuous)...")
     stop_count = 0
+    total_pixels = 0.0
     start_time = time.monotonic()
 
     # Start continuous movement
@@ -138,44 +275,106 @@ def measure_continuous_sweep(
     # Give motor a moment to get going
     time.sleep(0.3)
 
-    prev_gray = capture_gray(cap)
+    first, _ = capture_gray(cap)
+    # One clock base for the whole sweep, probed now that a frame has
+    # been read (see make_frame_clock)
+    clock = make_frame_clock(cap)
+    prev_ts = clock()
+    detector = MotionDetector(*first.shape, axis)
+    detector.step(first)  # prime with the first frame
+    recent: deque[float] = deque(maxlen=SMOOTH_WINDOW)
 
     while True:
         time.sleep(SAMPLE_INTERVAL)
-        curr_gray = capture_gray(cap)
+        curr_gray, ts = capture_gray(cap, clock)
 
-        shift = phase_shift(prev_gray, curr_gray, axis)
+        shift = detector.step(curr_gray)
+        total_pixels += shift
+        dt = ts - prev_ts
+        prev_ts = ts
         elapsed = time.monotonic() - start_time
-        status = "MOVING" if shift >= SHIFT_THRESHOLD else "stopped"
-        print(f"    {label}: {elapsed:.1f}s, shift={shift:.1f}px [{status}]")
 
-        if shift < SHIFT_THRESHOLD:
+        # Safety limit
+        if elapsed > 45.0:
+            print(f"  Safety limit reached at {elapsed:.1f}s")
+            break
+
+        if dt <= 0:
+            # Repeated or missing driver timestamp: the sample carries
+            # no velocity information. Recording it as 0.0 would read
+            # as "camera stopped" and end the sweep early.
+            continue
+
+        # Compare on velocity (px/s over the real inter-frame time) so
+        # the decision tracks physical motion, not scheduling jitter,
+        # and SAMPLE_INTERVAL can shrink without re-tuning thresholds
+        recent.append(shift / dt)
+        velocity = sum(recent) / len(recent)
+        status = "MOVING" if velocity >= VEL_THRESHOLD else "stopped"
+        print(f"    {label}: {elapsed:.1f}s, velocity={velocity:.1f}px/s [{status}]")
+
+        if velocity < VEL_THRESHOLD:
             stop_count += 1
             if stop_count >= CONSECUTIVE_STOPS:
                 break
         else:
             stop_count = 0
 
-        prev_gray = curr_gray
-
-        # Safety limit
-        if elapsed > 45.0:
-            print(f"  Safety limit reached at {elapsed:.1f}s")
-            break
-
     # Stop the motor
     set_speed(cam, control, 0)
     total = time.monotonic() - start_time
     # Subtract the time spent confirming it was stopped
     actual = total - SAMPLE_INTERVAL * CONSECUTIVE_STOPS
     actual = max(0.0, actual)
-    print(f"  Limit confirmed: {actual:.1f}s of travel")
+    print(f"  Limit confirmed: {actual:.1f}s / {total_pixels:.0f}px of travel")
     time.sleep(SETTLE_TIME)
-    return actual
+    return actual, total_pixels
+
+
+def seek_pixels(
+    cam: BCC950Controller,
+    cap: cv2.VideoCapture,
+    control: str,
+    speed: int,
+    axis: str,
+    target_pixels: float,
+) -> None:
+    """Move along one axis until the integrated frame shift reaches target.
+
+    Closed-loop alternative to sleeping for a wall-clock duration:
+    accumulate the measured per-sample shift and stop when the camera
+    has visibly travelled *target_pixels*, independent of motor-speed
+    variation.
+    """
+    first, _ = capture_gray(cap)
+    detector = MotionDetector(*first.shape, axis)
+    detector.step(first)  # prime
+    traveled = 0.0
+    start_time = time.monotonic()
+
+    set_speed(cam, control, speed)
+    while traveled < target_pixels:
+        time.sleep(SAMPLE_INTERVAL)
+        gray, _ = capture_gray(cap)
+        traveled += detector.step(gray)
+        if time.monotonic() - start_time > 45.0:
+            print("  Safety limit reached while seeking")
+            break
+    set_speed(cam, control, 0)
 
 
-def go_to_center(cam: BCC950Controller, pan_total: float, tilt_total: float) -> None:
-    """Move to center using measured ranges."""
+def go_to_center(
+    cam: BCC950Controller,
+    cap: cv2.VideoCapture,
+    pan_pixels: float,
+    tilt_pixels: float,
+) -> None:
+    """Move to center using measured pixel ranges (closed loop).
+
+    Slams to the left+down corner for a known starting point, then
+    drives each axis until half the measured sweep travel has been
+    observed on camera -- no dependence on wall-clock calibration.
+    """
     print("  Moving to center...")
     # Slam to left+down
     set_speed(cam, CTRL_PAN_SPEED, -1)
@@ -184,13 +383,9 @@ def go_to_center(cam: BCC950Controller, pan_total: float, tilt_total: float) ->
     set_speed(cam, CTRL_PAN_SPEED, 0)
     set_speed(cam, CTRL_TILT_SPEED, 0)
     time.sleep(SETTLE_TIME)
-    # Move half range to center
-    set_speed(cam, CTRL_PAN_SPEED, 1)
-    time.sleep(pan_total / 2)
-    set_speed(cam, CTRL_PAN_SPEED, 0)
-    set_speed(cam, CTRL_TILT_SPEED, 1)
-    time.sleep(tilt_total / 2)
-    set_speed(cam, CTRL_TILT_SPEED, 0)
+    # Drive half the measured travel on each axis, by observation
+    seek_pixels(cam, cap, CTRL_PAN_SPEED, 1, "pan", pan_pixels / 2)
+    seek_pixels(cam, cap, CTRL_TILT_SPEED, 1, "tilt", tilt_pixels / 2)
     time.sleep(SETTLE_TIME)
     print("  At center.")
 
@@ -211,11 +406,11 @@ def run_auto_tune(device: str | None, output_path: str) -> dict:
         print(f"Error: Could not open video device {cam.device}")
         sys.exit(1)
 
-    # Warmup
-    print("Warming up camera...")
-    for _ in range(WARMUP_FRAMES):
-        cap.read()
-    time.sleep(1.0)
+    # Let OpenCV's T-API kernels dispatch to OpenCL (e.g. the iGPU)
+    # where available; the explicit False avoids repeated device probes
+    # on machines without it.  The phase-correlation FFT itself runs in
+    # NumPy on a 256x256 ROI and is too small to gain from offload.
+    cv2.ocl.setUseOpenCL(cv2.ocl.haveOpenCL())
 
     photos_dir = os.path.join(PROJECT_ROOT, "reports", "photos")
     os.makedirs(photos_dir, exist_ok=True)
@@ -230,10 +425,11 @@ def run_auto_tune(device: str | None, output_path: str) -> dict:
     # (so camera ends at up-limit with good scene texture for pan)
     # =========================================
     print("\n=== Phase 1: Measure Tilt Range ===")
-    slam_to_limit(cam, CTRL_TILT_SPEED, -1, "down")
+    # Camera warmup (auto-exposure) happens during this first slam
+    slam_to_limit(cam, CTRL_TILT_SPEED, -1, "down", warmup_cap=cap)
     save_photo(cap, os.path.join(photos_dir, "full_down.jpg"), "Full Down")
 
-    tilt_total = measure_continuous_sweep(
+    tilt_total, tilt_pixels = measure_continuous_sweep(
         cam, cap, CTRL_TILT_SPEED, 1, "tilt", "tilt (down->up)")
     save_photo(cap, os.path.join(photos_dir, "full_up.jpg"), "Full Up")
     # Camera is now at UP limit — well-lit scene with texture
@@ -245,7 +441,7 @@ def run_auto_tune(device: str | None, output_path: str) -> dict:
     slam_to_limit(cam, CTRL_PAN_SPEED, -1, "left")
     save_photo(cap, os.path.join(photos_dir, "full_left.jpg"), "Full Left")
 
-    pan_total = measure_continuous_sweep(
+    pan_total, pan_pixels = measure_continuous_sweep(
         cam, cap, CTRL_PAN_SPEED, 1, "pan", "pan (left->right)")
     save_photo(cap, os.path.join(photos_dir, "full_right.jpg"), "Full Right")
 
@@ -253,7 +449,7 @@ def run_auto_tune(device: str | None, output_path: str) -> dict:
     # PHASE 3: Zoom photos
     # =========================================
     print("\n=== Phase 3: Zoom ===")
-    go_to_center(cam, pan_total, tilt_total)
+    go_to_center(cam, cap, pan_pixels, tilt_pixels)
     cam.zoom_to(ZOOM_MIN)
     time.sleep(SETTLE_TIME)
     save_photo(cap, os.path.join(photos_dir, "zoom_min.jpg"), "Zoom Min")
@@ -289,12 +485,15 @@ def run_auto_tune(device: str | None, output_path: str) -> dict:
         )
 
     # Center photo
-    go_to_center(cam, pan_total, tilt_total)
+    go_to_center(cam, cap, pan_pixels, tilt_pixels)
     save_photo(cap, os.path.join(photos_dir, "center.jpg"), "Center")
 
     cam.zoom_to(ZOOM_MIN)
     cap.release()
 
+    # Wait for any in-flight photo writes before reporting success
+    _photo_executor.shutdown(wait=True)
+
     # =========================================
     # Save calibration
     # =========================================
@@ -302,9 +501,11 @@ def run_auto_tune(device: str | None, output_path: str) -> dict:
         "pan_total_seconds": round(pan_total, 1),
         "pan_left_seconds": round(pan_total / 2, 1),
         "pan_right_seconds": round(pan_total / 2, 1),
+        "pan_total_pixels": round(pan_pixels),
         "tilt_total_seconds": round(tilt_total, 1),
         "tilt_up_seconds": round(tilt_total / 2, 1),
         "tilt_down_seconds": round(tilt_total / 2, 1),
+        "tilt_total_pixels": round(tilt_pixels),
         "zoom_min": ZOOM_MIN,
         "zoom_max": ZOOM_MAX,
         "measured_at": datetime.datetime.now().isoformat(),
@@ -19,17 +19,39 @@ import time
 # Ensure bcc950 package is importable
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "python"))
 
+# Color only when talking to a terminal: redirected logs stay clean,
+# and the escape strings are built once instead of per check
+_IS_TTY = sys.stdout.isatty()
+_PASS = "\033[32mPASS\033[0m" if _IS_TTY else "PASS"
+_FAIL = "\033[31mFAIL\033[0m" if _IS_TTY else "FAIL"
+_GREEN = "\033[32m" if _IS_TTY else ""
+_RED = "\033[31m" if _IS_TTY else ""
+_RESET = "\033[0m" if _IS_TTY else ""
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="BCC950 Hardware Verification")
     parser.add_argument("--device", default=None, help="V4L2 device path (auto-detect if omitted)")
+    parser.add_argument("--skip-frame-capture", action="store_true",
+                        help="Skip the OpenCV frame capture (pure mechanical smoke test, "
+                             "never imports cv2)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Skip the pauses between choreography steps (the moves "
+                             "themselves still run their full duration)")
     args = parser.parse_args()
 
+    def settle(seconds: float) -> None:
+        # Each movement call blocks for its commanded duration and stops
+        # the motors itself; this pause only paces the choreography for
+        # a human watching the head, so --fast drops it entirely.
+        if not args.fast:
+            time.sleep(seconds)
+
     results: list[tuple[str, bool, str]] = []
 
     def check(name: str, passed: bool, detail: str = "") -> bool:
         results.append((name, passed, detail))
-        status = "\033[32mPASS\033[0m" if passed else "\033[31mFAIL\033[0m"
+        status = _PASS if passed else _FAIL
         line = f"  [{status}] {name}"
         if detail:
             line += f"  ({detail})"
@@ -90,7 +112,7 @@ def main() -> None:
     # Pan left
     try:
         cam.pan_left(0.5)
-        time.sleep(0.3)
+        settle(0.3)
         check("Pan left (0.5s)", True)
     except Exception as e:
         check("Pan left", False, str(e))
@@ -98,7 +120,7 @@ def main() -> None:
     # Pan right
     try:
         cam.pan_right(0.5)
-        time.sleep(0.3)
+        settle(0.3)
         check("Pan right (0.5s)", True)
     except Exception as e:
         check("Pan right", False, str(e))
@@ -106,7 +128,7 @@ def main() -> None:
     # Tilt up
     try:
         cam.tilt_up(0.3)
-        time.sleep(0.3)
+        settle(0.3)
         check("Tilt up (0.3s)", True)
     except Exception as e:
         check("Tilt up", False, str(e))
@@ -114,7 +136,7 @@ def main() -> None:
     # Tilt down
     try:
         cam.tilt_down(0.3)
-        time.sleep(0.3)
+        settle(0.3)
         check("Tilt down (0.3s)", True)
     except Exception as e:
         check("Tilt down", False, str(e))
@@ -122,7 +144,7 @@ def main() -> None:
     # Zoom in
     try:
         cam.zoom_to(300)
-        time.sleep(0.5)
+        settle(0.5)
         check("Zoom to 300", True)
     except Exception as e:
         check("Zoom to 300", False, str(e))
@@ -130,7 +152,7 @@ def main() -> None:
     # Zoom out
     try:
         cam.zoom_to(100)
-        time.sleep(0.3)
+        settle(0.3)
         check("Zoom to 100 (reset)", True)
     except Exception as e:
         check("Zoom to 100", False, str(e))
@@ -138,33 +160,38 @@ def main() -> None:
     # Combined move
     try:
         cam.move(pan_dir=-1, tilt_dir=1, duration=0.3)
-        time.sleep(0.2)
+        settle(0.2)
         cam.move(pan_dir=1, tilt_dir=-1, duration=0.3)
         check("Combined pan+tilt move", True)
     except Exception as e:
         check("Combined move", False, str(e))
 
-    # Step 6: Frame capture via OpenCV
+    # Step 6: Frame capture via OpenCV. cv2 is imported here, not at
+    # module scope: the import costs ~200-400ms and a mechanical-only
+    # run with --skip-frame-capture never pays it.
     print()
-    try:
-        import cv2
-        cap = cv2.VideoCapture(cam.device)
-        if cap.isOpened():
-            ret, frame = cap.read()
-            cap.release()
-            if ret and frame is not None:
-                h, w = frame.shape[:2]
-                out_path = "/tmp/bcc950_test.jpg"
-                cv2.imwrite(out_path, frame)
-                check("Capture frame via OpenCV", True, f"{w}x{h} saved to {out_path}")
+    if args.skip_frame_capture:
+        check("Capture frame via OpenCV", True, "skipped")
+    else:
+        try:
+            import cv2
+            cap = cv2.VideoCapture(cam.device)
+            if cap.isOpened():
+                ret, frame = cap.read()
+                cap.release()
+                if ret and frame is not None:
+                    h, w = frame.shape[:2]
+                    out_path = "/tmp/bcc950_test.jpg"
+                    cv2.imwrite(out_path, frame)
+                    check("Capture frame via OpenCV", True, f"{w}x{h} saved to {out_path}")
+                else:
+                    check("Capture frame via OpenCV", False, "read() returned empty")
             else:
-                check("Capture frame via OpenCV", False, "read() returned empty")
-        else:
-            check("Capture frame via OpenCV", False, f"could not open {cam.device}")
-    except ImportError:
-        check("Capture frame via OpenCV", False, "opencv-python not installed")
-    except Exception as e:
-        check("Capture frame via OpenCV", False, str(e))
+                check("Capture frame via OpenCV", False, f"could not open {cam.device}")
+        except ImportError:
+            check("Capture frame via OpenCV", False, "opencv-python not installed")
+        except Exception as e:
+            check("Capture frame via OpenCV", False, str(e))
 
     # Step 7: Read zoom from hardware
     try:
@@ -180,9 +207,9 @@ def main() -> None:
     total = len(results)
     failed = total - passed
     if failed == 0:
-        print(f"  \033[32mAll {total} checks passed!\033[0m")
+        print(f"  {_GREEN}All {total} checks passed!{_RESET}")
     else:
-        print(f"  {passed}/{total} passed, \033[31m{failed} failed\033[0m")
+        print(f"  {passed}/{total} passed, {_RED}{failed} failed{_RESET}")
     print("=" * 50)
 
     sys.exit(0 if failed == 0 else 1)
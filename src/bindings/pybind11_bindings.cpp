@@ -46,6 +46,32 @@ static uint32_t resolve_control(const std::string& name) {
                           "'tilt_speed', 'zoom_absolute'.");
 }
 
+// Write several controls in one VIDIOC_S_EXT_CTRLS ioctl so e.g. pan
+// and tilt start in the same driver transaction. Falls back to serial
+// VIDIOC_S_CTRL writes if the device rejects ext controls.
+static void set_controls_batch(
+    bcc950::V4L2Device& dev,
+    const std::vector<std::pair<std::string, int32_t>>& controls) {
+    if (!dev.is_open()) {
+        throw bcc950::V4L2Error("Device not open");
+    }
+    std::vector<struct v4l2_ext_control> ctrls(controls.size());
+    for (size_t i = 0; i < controls.size(); ++i) {
+        ctrls[i] = {};
+        ctrls[i].id = resolve_control(controls[i].first);
+        ctrls[i].value = controls[i].second;
+    }
+    struct v4l2_ext_controls ext{};
+    ext.which = V4L2_CTRL_WHICH_CUR_VAL;
+    ext.count = static_cast<uint32_t>(ctrls.size());
+    ext.controls = ctrls.data();
+    if (::ioctl(dev.fd(), VIDIOC_S_EXT_CTRLS, &ext) < 0) {
+        for (const auto& ctrl : ctrls) {
+            dev.set_control(ctrl.id, ctrl.value);
+        }
+    }
+}
+
 // Enumerate V4L2 controls on an open device fd.
 static std::string enumerate_controls(bcc950::V4L2Device& dev) {
     if (!dev.is_open()) {
@@ -138,7 +164,8 @@ PYBIND11_MODULE(_bcc950_native, m) {
                  return self.get_control(resolve_control(name));
              },
              py::arg("control"))
-        .def("list_controls", &enumerate_controls);
+        .def("list_controls", &enumerate_controls)
+        .def("set_controls", &set_controls_batch, py::arg("controls"));
 
     // Module-level device scanner
     m.def("list_devices", &scan_devices,
@@ -3,10 +3,11 @@
 from .controller import BCC950Controller
 from .motion_verify import MotionVerifier
 from .position import PositionTracker
-from .v4l2_backend import SubprocessV4L2Backend, V4L2Backend
+from .v4l2_backend import IoctlV4L2Backend, SubprocessV4L2Backend, V4L2Backend
 
 __all__ = [
     "BCC950Controller",
+    "IoctlV4L2Backend",
     "MotionVerifier",
     "PositionTracker",
     "SubprocessV4L2Backend",
@@ -60,9 +60,20 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Parser construction is reflection-heavy argparse work; build it once
+# and reuse it for repeated main() calls (tests, embedding callers).
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
+
+
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = _get_parser().parse_args(argv)
 
     ctrl = BCC950Controller(device=args.device)
     duration = args.duration or 0.1
@@ -101,6 +112,7 @@ def main(argv: list[str] | None = None) -> int:
 
     elif args.save_preset:
         ctrl.save_preset(args.save_preset)
+        ctrl.flush_presets()
         print(f"Saved preset: {args.save_preset}")
     elif args.recall_preset:
         if ctrl.recall_preset(args.recall_preset):
@@ -110,6 +122,7 @@ def main(argv: list[str] | None = None) -> int:
             return 1
     elif args.delete_preset:
         if ctrl.delete_preset(args.delete_preset):
+            ctrl.flush_presets()
             print(f"Deleted preset: {args.delete_preset}")
         else:
             print(f"Preset not found: {args.delete_preset}")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import mmap
+import os
 from pathlib import Path
 from typing import Any
 
@@ -14,79 +16,117 @@ from .constants import (
 )
 
 
-class Config:
-    """Manages BCC950 configuration load/save from ~/.bcc950_config."""
+# Parsed-config cache keyed by (path, mtime_ns, size): repeat load()s
+# of an unchanged file skip the mmap and parse entirely. Config files
+# are tiny and few, so the cache is never evicted.
+_CFG_CACHE: dict[tuple[str, int, int], tuple[str, int, int, int]] = {}
+
 
-    DEFAULTS: dict[str, Any] = {
-        "DEVICE": DEFAULT_DEVICE,
-        "PAN_SPEED": DEFAULT_PAN_SPEED,
-        "TILT_SPEED": DEFAULT_TILT_SPEED,
-        "ZOOM_STEP": DEFAULT_ZOOM_STEP,
+class Config:
+    """Manages BCC950 configuration load/save from ~/.bcc950_config.
+
+    The known settings are plain slot attributes rather than entries in
+    a backing dict: ``config.pan_speed`` is read on every movement
+    command, and a slot load is cheaper than a property call plus a
+    dict lookup.
+    """
+
+    __slots__ = ("path", "device", "pan_speed", "tilt_speed", "zoom_step", "_extra")
+
+    # File key -> attribute name, in file order
+    _KEY_ATTRS = {
+        "DEVICE": "device",
+        "PAN_SPEED": "pan_speed",
+        "TILT_SPEED": "tilt_speed",
+        "ZOOM_STEP": "zoom_step",
     }
 
     INT_KEYS = {"PAN_SPEED", "TILT_SPEED", "ZOOM_STEP"}
 
+    # Byte-keyed views of the above: the loader parses the raw bytes
+    # directly, so keys never take a decode detour through str
+    _KEY_ATTRS_B = {key.encode(): attr for key, attr in _KEY_ATTRS.items()}
+    _INT_KEYS_B = frozenset(key.encode() for key in INT_KEYS)
+
     def __init__(self, config_path: Path | None = None):
         self.path = config_path or (Path.home() / DEFAULT_CONFIG_FILENAME)
-        self._data: dict[str, Any] = dict(self.DEFAULTS)
-
-    @property
-    def device(self) -> str:
-        return self._data["DEVICE"]
-
-    @device.setter
-    def device(self, value: str) -> None:
-        self._data["DEVICE"] = value
-
-    @property
-    def pan_speed(self) -> int:
-        return self._data["PAN_SPEED"]
-
-    @pan_speed.setter
-    def pan_speed(self, value: int) -> None:
-        self._data["PAN_SPEED"] = value
-
-    @property
-    def tilt_speed(self) -> int:
-        return self._data["TILT_SPEED"]
-
-    @tilt_speed.setter
-    def tilt_speed(self, value: int) -> None:
-        self._data["TILT_SPEED"] = value
-
-    @property
-    def zoom_step(self) -> int:
-        return self._data["ZOOM_STEP"]
-
-    @zoom_step.setter
-    def zoom_step(self, value: int) -> None:
-        self._data["ZOOM_STEP"] = value
+        self.device: str = DEFAULT_DEVICE
+        self.pan_speed: int = DEFAULT_PAN_SPEED
+        self.tilt_speed: int = DEFAULT_TILT_SPEED
+        self.zoom_step: int = DEFAULT_ZOOM_STEP
+        self._extra: dict[str, Any] = {}
 
     def load(self) -> None:
         """Load config from file. Missing file is silently ignored."""
-        if not self.path.exists():
+        # mmap the file and scan for newlines ourselves: no read()
+        # copy, no text decode, one C-level find per line. This runs
+        # on every controller construction, including one-shot CLI
+        # calls.
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if st.st_size == 0:
+            # mmap refuses zero-length files; nothing to parse anyway
+            return
+        cache_key = (str(self.path), st.st_mtime_ns, st.st_size)
+        cached = _CFG_CACHE.get(cache_key)
+        if cached is not None:
+            self.device, self.pan_speed, self.tilt_speed, self.zoom_step = cached
+            return
+        try:
+            with open(self.path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start = 0
+                    while (nl := mm.find(b"\n", start)) != -1:
+                        self._parse_line(mm[start:nl])
+                        start = nl + 1
+                    if start < len(mm):
+                        # Final line without a trailing newline
+                        self._parse_line(mm[start:])
+        except FileNotFoundError:
+            return
+        _CFG_CACHE[cache_key] = (
+            self.device, self.pan_speed, self.tilt_speed, self.zoom_step,
+        )
+
+    def _parse_line(self, line: bytes) -> None:
+        line = line.strip()
+        if not line or line.startswith(b"#"):
+            return
+        key, sep, value = line.partition(b"=")
+        if not sep:
             return
-        with open(self.path) as f:
-            for line in f:
-                line = line.strip()
-                if "=" in line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key in self._data:
-                        if key in self.INT_KEYS:
-                            self._data[key] = int(value)
-                        else:
-                            self._data[key] = value
+        key = key.strip()
+        attr = self._KEY_ATTRS_B.get(key)
+        if attr is not None:
+            value = value.strip()
+            # int() parses ASCII bytes directly; only DEVICE needs str
+            setattr(self, attr,
+                    int(value) if key in self._INT_KEYS_B else value.decode())
 
     def save(self) -> None:
         """Save current config to file."""
-        with open(self.path, "w") as f:
-            for key, value in self._data.items():
-                f.write(f"{key}={value}\n")
+        # Format everything up front and write in one syscall:
+        # open/write/close instead of a buffered-text write per line
+        lines = [f"{key}={getattr(self, attr)}" for key, attr in self._KEY_ATTRS.items()]
+        lines.extend(f"{key}={value}" for key, value in self._extra.items())
+        buf = ("\n".join(lines) + "\n").encode()
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, buf)
+        finally:
+            os.close(fd)
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self._data.get(key, default)
+        attr = self._KEY_ATTRS.get(key)
+        if attr is not None:
+            return getattr(self, attr)
+        return self._extra.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        self._data[key] = value
+        attr = self._KEY_ATTRS.get(key)
+        if attr is not None:
+            setattr(self, attr, value)
+        else:
+            self._extra[key] = value
@@ -17,9 +17,10 @@ from .constants import (
 )
 from .discovery import find_bcc950, has_ptz_support
 from .motion import MotionController
+from .native_backend import auto_backend
 from .position import PositionTracker
 from .presets import PresetManager
-from .v4l2_backend import SubprocessV4L2Backend, V4L2Backend
+from .v4l2_backend import V4L2Backend
 
 if TYPE_CHECKING:
     import cv2
@@ -45,12 +46,27 @@ class BCC950Controller:
         self._config = Config(config_path)
         self._config.load()
 
-        self._backend = backend or SubprocessV4L2Backend()
+        # Native bindings when built, else direct ioctls; either avoids
+        # a v4l2-ctl fork per control op, and the ioctl backend
+        # delegates to v4l2-ctl itself when a device refuses
+        self._backend = backend or auto_backend()
         self._device = device or self._config.device
+        # Cache the configured speeds/step: pan_left() and friends sit
+        # on the interactive hot path and shouldn't re-read config per
+        # call. find_camera() only rewrites DEVICE, never these.
+        self._pan_speed = self._config.pan_speed
+        self._tilt_speed = self._config.tilt_speed
+        self._zoom_step = self._config.zoom_step
         self._position = PositionTracker()
         self._motion = MotionController(self._backend, self._device, self._position)
         self._presets = PresetManager(presets_path)
 
+    def __enter__(self) -> BCC950Controller:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush_presets()
+
     # --- Video / motion verification ---
 
     def attach_video(self, cap: cv2.VideoCapture) -> None:
@@ -95,27 +111,27 @@ class BCC950Controller:
 
     def pan_left(self, duration: float = DEFAULT_MOVE_DURATION) -> bool:
         """Pan camera left. Returns True if the camera moved."""
-        return self._motion.pan(-self._config.pan_speed, duration)
+        return self._motion.pan(-self._pan_speed, duration)
 
     def pan_right(self, duration: float = DEFAULT_MOVE_DURATION) -> bool:
         """Pan camera right. Returns True if the camera moved."""
-        return self._motion.pan(self._config.pan_speed, duration)
+        return self._motion.pan(self._pan_speed, duration)
 
     def tilt_up(self, duration: float = DEFAULT_MOVE_DURATION) -> bool:
         """Tilt camera up. Returns True if the camera moved."""
-        return self._motion.tilt(self._config.tilt_speed, duration)
+        return self._motion.tilt(self._tilt_speed, duration)
 
     def tilt_down(self, duration: float = DEFAULT_MOVE_DURATION) -> bool:
         """Tilt camera down. Returns True if the camera moved."""
-        return self._motion.tilt(-self._config.tilt_speed, duration)
+        return self._motion.tilt(-self._tilt_speed, duration)
 
     def zoom_in(self) -> None:
         """Zoom camera in by one step."""
-        self._motion.zoom_relative(self._config.zoom_step)
+        self._motion.zoom_relative(self._zoom_step)
 
     def zoom_out(self) -> None:
         """Zoom camera out by one step."""
-        self._motion.zoom_relative(-self._config.zoom_step)
+        self._motion.zoom_relative(-self._zoom_step)
 
     def reset_position(self) -> None:
         """Reset camera to center and minimum zoom."""
@@ -152,7 +168,11 @@ class BCC950Controller:
         return self._motion.combined_move_with_zoom(pan_dir, tilt_dir, zoom_target, duration)
 
     def save_preset(self, name: str) -> None:
-        """Save current position as a named preset."""
+        """Save current position as a named preset.
+
+        Buffered in memory; persisted by :meth:`flush_presets` or on
+        exit when the controller is used as a context manager.
+        """
         self._presets.save_preset(name, self._position)
 
     def recall_preset(self, name: str) -> bool:
@@ -171,16 +191,28 @@ class BCC950Controller:
         """List all preset names."""
         return self._presets.list_presets()
 
+    def flush_presets(self) -> None:
+        """Persist any buffered preset changes to disk."""
+        self._presets.flush()
+
     # --- Discovery / Setup ---
 
     def find_camera(self) -> str | None:
         """Auto-detect BCC950 camera device."""
+        # Fast path: the device cached in config from a previous run is
+        # usually still correct; confirming PTZ support on it is much
+        # cheaper than the full list_devices scan.
+        if self._device and os.path.exists(self._device) and \
+                has_ptz_support(self._backend, self._device):
+            return self._device
         device = find_bcc950(self._backend)
         if device:
             self._device = device
             self._motion._device = device
-            self._config.device = device
-            self._config.save()
+            if self._config.device != device:
+                # Only rewrite the config file when the device changed
+                self._config.device = device
+                self._config.save()
         return device
 
     def has_ptz_support(self) -> bool:
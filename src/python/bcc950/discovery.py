@@ -2,22 +2,59 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 import re
+import time
 from pathlib import Path
 
 from .v4l2_backend import V4L2Backend
 
+# Control-list queries fork v4l2-ctl (~10-40ms); callers such as
+# BCC950Controller setup and the verification scripts re-query the same
+# device several times in quick succession, so cache the parsed names
+# for a short window.
+_CONTROLS_TTL = 2.0
+_controls_cache: dict[str, tuple[float, set[str]]] = {}
 
+_PTZ_CONTROLS = frozenset({"pan_speed", "tilt_speed", "zoom_absolute"})
+
+_DEV_VIDEO_RE = re.compile(r"/dev/video\d+")
+
+
+def _control_names(backend: V4L2Backend, device: str) -> set[str]:
+    """Parsed control names for *device*, cached for _CONTROLS_TTL."""
+    now = time.monotonic()
+    hit = _controls_cache.get(device)
+    if hit is not None and now - hit[0] < _CONTROLS_TTL:
+        return hit[1]
+    names = set()
+    for line in backend.list_controls(device).splitlines():
+        tokens = line.split()
+        if len(tokens) >= 2 and tokens[1].startswith("0x"):
+            names.add(tokens[0])
+    _controls_cache[device] = (now, names)
+    return names
+
+
+_OS_ID_RE = re.compile(r'^ID=["\']?([^"\'\n]+)', re.M)
+
+
+@functools.lru_cache(maxsize=1)
 def detect_os() -> str:
-    """Detect the current operating system ID."""
-    os_release = Path("/etc/os-release")
-    if os_release.exists():
-        with open(os_release) as f:
-            for line in f:
-                if line.startswith("ID="):
-                    return line.split("=")[1].strip().strip('"')
+    """Detect the current operating system ID.
+
+    /etc/os-release cannot change during the process lifetime, so the
+    result is computed once and cached.
+    """
+    try:
+        text = Path("/etc/os-release").read_text()
+    except OSError:
+        return platform.system().lower()
+    match = _OS_ID_RE.search(text)
+    if match:
+        return match.group(1).strip()
     return platform.system().lower()
 
 
@@ -31,13 +68,20 @@ def find_bcc950(backend: V4L2Backend) -> str | None:
     except Exception:
         return None
 
-    # Try to find BCC950 by name
-    if "BCC950" in devices_output:
-        match = re.search(
-            r"BCC950.*?\n(.*?/dev/video\d+)", devices_output, re.DOTALL
-        )
-        if match:
-            return match.group(1).strip()
+    # Try to find BCC950 by name: v4l2-ctl groups device nodes as
+    # indented lines under each card's header. A single line scan
+    # avoids the backtracking of a non-greedy DOTALL search.
+    in_bcc950_group = False
+    for line in devices_output.splitlines():
+        if "BCC950" in line:
+            in_bcc950_group = True
+            continue
+        if in_bcc950_group:
+            match = _DEV_VIDEO_RE.search(line)
+            if match:
+                return match.group(0)
+            if line and not line[0].isspace():
+                in_bcc950_group = False
 
     # Fall back to checking all video devices for PTZ support
     return _find_ptz_device(backend)
@@ -45,13 +89,20 @@ def find_bcc950(backend: V4L2Backend) -> str | None:
 
 def _find_ptz_device(backend: V4L2Backend) -> str | None:
     """Find any video device with PTZ support."""
-    video_devices = sorted(
-        str(p) for p in Path("/dev").glob("video*")
-    )
-    for dev in video_devices:
+    try:
+        with os.scandir("/dev") as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.startswith("video") and entry.name[5:].isdigit()
+            ]
+    except OSError:
+        return None
+    # Probe in index order and stop at the first PTZ-capable device
+    for name in sorted(names, key=lambda n: int(n[5:])):
+        dev = f"/dev/{name}"
         try:
-            controls = backend.list_controls(dev)
-            if "pan_speed" in controls:
+            if "pan_speed" in _control_names(backend, dev):
                 return dev
         except Exception:
             continue
@@ -63,10 +114,6 @@ def has_ptz_support(backend: V4L2Backend, device: str) -> bool:
     if not os.path.exists(device):
         return False
     try:
-        controls = backend.list_controls(device)
-        return all(
-            ctrl in controls
-            for ctrl in ("pan_speed", "tilt_speed", "zoom_absolute")
-        )
+        return _PTZ_CONTROLS.issubset(_control_names(backend, device))
     except Exception:
         return False
@@ -24,10 +24,14 @@ if TYPE_CHECKING:
 class MotionController:
     """Thread-safe motion control for the BCC950.
 
-    All movement methods acquire a mutex so that start-sleep-stop
-    sequences are atomic.  When a *verifier* is provided, frame
-    comparison is used to detect whether the camera actually moved,
-    enabling automatic limit discovery.
+    Two locks with distinct jobs: ``_move_lock`` serializes whole
+    start-sleep-stop sequences so concurrent moves cannot interleave,
+    while ``_lock`` guards only the hardware writes themselves. The
+    duration sleep happens outside ``_lock``, so :meth:`stop` from
+    another thread takes effect immediately instead of queueing behind
+    an in-flight move.  When a *verifier* is provided, frame comparison
+    is used to detect whether the camera actually moved, enabling
+    automatic limit discovery.
     """
 
     def __init__(
@@ -39,9 +43,20 @@ class MotionController:
         self._backend = backend
         self._device = device
         self._lock = threading.Lock()
+        self._move_lock = threading.Lock()
         self.position = position or PositionTracker()
         self.verifier: MotionVerifier | None = None
 
+    def _set_many(self, pairs: list[tuple[str, int]]) -> None:
+        """Apply several controls, in one batched ioctl when the backend
+        supports set_controls, otherwise serially."""
+        set_controls = getattr(self._backend, "set_controls", None)
+        if set_controls is not None:
+            set_controls(self._device, pairs)
+        else:
+            for control, value in pairs:
+                self._backend.set_control(self._device, control, value)
+
     def pan(
         self,
         direction: int,
@@ -54,11 +69,13 @@ class MotionController:
         """
         speed = max(-1, min(1, direction))
         v = verifier or self.verifier
-        with self._lock:
+        with self._move_lock:
             before = v.grab_gray() if v else None
-            self._backend.set_control(self._device, CTRL_PAN_SPEED, speed)
+            with self._lock:
+                self._backend.set_control(self._device, CTRL_PAN_SPEED, speed)
             time.sleep(duration)
-            self._backend.set_control(self._device, CTRL_PAN_SPEED, 0)
+            with self._lock:
+                self._backend.set_control(self._device, CTRL_PAN_SPEED, 0)
             moved = True
             if v and before is not None:
                 after = v.grab_gray()
@@ -78,11 +95,13 @@ class MotionController:
         """
         speed = max(-1, min(1, direction))
         v = verifier or self.verifier
-        with self._lock:
+        with self._move_lock:
             before = v.grab_gray() if v else None
-            self._backend.set_control(self._device, CTRL_TILT_SPEED, speed)
+            with self._lock:
+                self._backend.set_control(self._device, CTRL_TILT_SPEED, speed)
             time.sleep(duration)
-            self._backend.set_control(self._device, CTRL_TILT_SPEED, 0)
+            with self._lock:
+                self._backend.set_control(self._device, CTRL_TILT_SPEED, 0)
             moved = True
             if v and before is not None:
                 after = v.grab_gray()
@@ -104,19 +123,24 @@ class MotionController:
         pan_speed = max(-1, min(1, pan_dir))
         tilt_speed = max(-1, min(1, tilt_dir))
         v = verifier or self.verifier
-        with self._lock:
+        with self._move_lock:
             before = v.grab_gray() if v else None
-            self._backend.set_control(self._device, CTRL_PAN_SPEED, pan_speed)
-            self._backend.set_control(self._device, CTRL_TILT_SPEED, tilt_speed)
+            with self._lock:
+                self._set_many([
+                    (CTRL_PAN_SPEED, pan_speed),
+                    (CTRL_TILT_SPEED, tilt_speed),
+                ])
             time.sleep(duration)
-            self._backend.set_control(self._device, CTRL_PAN_SPEED, 0)
-            self._backend.set_control(self._device, CTRL_TILT_SPEED, 0)
+            with self._lock:
+                self._set_many([
+                    (CTRL_PAN_SPEED, 0),
+                    (CTRL_TILT_SPEED, 0),
+                ])
             pan_moved = True
             tilt_moved = True
             if v and before is not None:
                 after = v.grab_gray()
-                pan_moved = v.did_pan(before, after)
-                tilt_moved = v.did_tilt(before, after)
+                pan_moved, tilt_moved = v.did_pan_tilt(before, after)
             self.position.update_pan(pan_speed, duration, pan_moved)
             self.position.update_tilt(tilt_speed, duration, tilt_moved)
             return pan_moved, tilt_moved
@@ -137,25 +161,66 @@ class MotionController:
         tilt_speed = max(-1, min(1, tilt_dir))
         zoom_target = max(ZOOM_MIN, min(ZOOM_MAX, zoom_target))
         v = verifier or self.verifier
-        with self._lock:
+        with self._move_lock:
             before = v.grab_gray() if v else None
-            self._backend.set_control(self._device, CTRL_PAN_SPEED, pan_speed)
-            self._backend.set_control(self._device, CTRL_TILT_SPEED, tilt_speed)
-            self._backend.set_control(self._device, CTRL_ZOOM_ABSOLUTE, zoom_target)
+            with self._lock:
+                self._set_many([
+                    (CTRL_PAN_SPEED, pan_speed),
+                    (CTRL_TILT_SPEED, tilt_speed),
+                    (CTRL_ZOOM_ABSOLUTE, zoom_target),
+                ])
             time.sleep(duration)
-            self._backend.set_control(self._device, CTRL_PAN_SPEED, 0)
-            self._backend.set_control(self._device, CTRL_TILT_SPEED, 0)
+            with self._lock:
+                self._set_many([
+                    (CTRL_PAN_SPEED, 0),
+                    (CTRL_TILT_SPEED, 0),
+                ])
             pan_moved = True
             tilt_moved = True
             if v and before is not None:
                 after = v.grab_gray()
-                pan_moved = v.did_pan(before, after)
-                tilt_moved = v.did_tilt(before, after)
+                pan_moved, tilt_moved = v.did_pan_tilt(before, after)
             self.position.update_pan(pan_speed, duration, pan_moved)
             self.position.update_tilt(tilt_speed, duration, tilt_moved)
             self.position.update_zoom(zoom_target)
             return pan_moved, tilt_moved
 
+    def execute_sequence(self, moves: list[tuple[int, int, float]]) -> None:
+        """Run a list of ``(pan_dir, tilt_dir, duration)`` legs back to back.
+
+        Consecutive legs that keep an axis at the same speed elide the
+        stop+restart between them, so a continuous sweep decelerates
+        and re-accelerates only where the direction actually changes.
+        One final stop is issued after the last leg. Moves are not
+        verified; position is updated per leg as if each succeeded.
+        """
+        if not moves:
+            return
+        with self._move_lock:
+            prev_pan = prev_tilt = 0
+            for pan_dir, tilt_dir, duration in moves:
+                pan_speed = max(-1, min(1, pan_dir))
+                tilt_speed = max(-1, min(1, tilt_dir))
+                changed = []
+                if pan_speed != prev_pan:
+                    changed.append((CTRL_PAN_SPEED, pan_speed))
+                if tilt_speed != prev_tilt:
+                    changed.append((CTRL_TILT_SPEED, tilt_speed))
+                if changed:
+                    with self._lock:
+                        self._set_many(changed)
+                time.sleep(duration)
+                if pan_speed:
+                    self.position.update_pan(pan_speed, duration)
+                if tilt_speed:
+                    self.position.update_tilt(tilt_speed, duration)
+                prev_pan, prev_tilt = pan_speed, tilt_speed
+            with self._lock:
+                self._set_many([
+                    (CTRL_PAN_SPEED, 0),
+                    (CTRL_TILT_SPEED, 0),
+                ])
+
     def zoom_absolute(self, value: int) -> None:
         """Set zoom to an absolute value (clamped to ZOOM_MIN..ZOOM_MAX)."""
         value = max(ZOOM_MIN, min(ZOOM_MAX, value))
@@ -173,5 +238,7 @@ class MotionController:
     def stop(self) -> None:
         """Stop all movement."""
         with self._lock:
-            self._backend.set_control(self._device, CTRL_PAN_SPEED, 0)
-            self._backend.set_control(self._device, CTRL_TILT_SPEED, 0)
+            self._set_many([
+                (CTRL_PAN_SPEED, 0),
+                (CTRL_TILT_SPEED, 0),
+            ])
@@ -21,34 +21,103 @@ class MotionVerifier:
         Open video capture on the camera device.
     shift_threshold : float
         Minimum pixel shift to consider the camera as having moved.
+    downsample : int
+        Factor to shrink frames by before phase correlation. A short
+        move shifts the image by tens of pixels, which quarter
+        resolution resolves easily while the FFT costs ~16x less.
+    diff_threshold : float
+        Mean absolute pixel difference above which :meth:`did_move`
+        considers the scene to have changed.
+    raw_gray : bool
+        Capture raw YUYV instead of letting OpenCV decode to BGR.
+        The Y plane *is* the grayscale image, so :meth:`grab_gray`
+        becomes a strided copy with no color conversion at all.
+        Opt-in because it reconfigures the capture: :meth:`grab_frame`
+        then has to decode YUYV itself, and the capture should not be
+        shared with consumers expecting BGR frames.
     """
 
-    def __init__(self, cap: cv2.VideoCapture, shift_threshold: float = 3.0):
+    def __init__(self, cap: cv2.VideoCapture, shift_threshold: float = 3.0,
+                 downsample: int = 4, diff_threshold: float = 2.0,
+                 raw_gray: bool = False):
         self._cap = cap
         self.shift_threshold = shift_threshold
-
-    def grab_gray(self) -> np.ndarray:
-        """Capture a fresh grayscale frame, flushing stale buffer."""
-        for _ in range(3):
-            self._cap.read()
+        self.downsample = downsample
+        self.diff_threshold = diff_threshold
+        self.raw_gray = raw_gray
+        if raw_gray:
+            self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"YUYV"))
+            self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+        # Hanning window for the (fixed) downsampled frame shape,
+        # built lazily on the first measurement and reused after
+        self._window: np.ndarray | None = None
+        # With only the newest frame buffered, a grab needs one flush
+        # instead of three full decoded reads (~100ms at 30fps). Not
+        # every capture backend honors this property; the single grab()
+        # below covers the ones that ignore it.
+        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    @classmethod
+    def from_gstreamer(cls, device: str, **kwargs) -> MotionVerifier:
+        """Build a verifier on a GStreamer appsink pipeline for *device*.
+
+        ``max-buffers=1 drop=true`` guarantees one-frame latency at the
+        capture layer (no stale-buffer flushing at all), and GRAY8
+        output makes :meth:`grab_gray` a plain copy with no BGR->gray
+        conversion pass. Requires an OpenCV build with GStreamer
+        support; raises RuntimeError if the pipeline cannot open.
+        """
+        pipeline = (
+            f"v4l2src device={device} ! videoconvert ! "
+            "video/x-raw,format=GRAY8 ! "
+            "appsink max-buffers=1 drop=true sync=false"
+        )
+        cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+        if not cap.isOpened():
+            raise RuntimeError(f"Failed to open GStreamer pipeline for {device}")
+        return cls(cap, **kwargs)
+
+    def _grab(self) -> np.ndarray:
+        """Capture a fresh frame, discarding at most one stale one."""
+        # grab() skips the decode of the discarded frame, unlike read()
+        self._cap.grab()
         ret, frame = self._cap.read()
         if not ret or frame is None:
             raise RuntimeError("Failed to capture frame")
+        return frame
+
+    def grab_gray(self) -> np.ndarray:
+        """Capture a fresh grayscale frame, flushing stale buffer."""
+        frame = self._grab()
+        if self.raw_gray:
+            # Packed YUYV: every even byte along a row is luma.
+            # Backends deliver raw frames as (h, w, 2) or flat (h, 2w).
+            if frame.ndim == 3:
+                return np.ascontiguousarray(frame[:, :, 0])
+            return np.ascontiguousarray(frame[:, ::2])
+        if frame.ndim == 2:
+            # Already single-channel (e.g. GRAY8 GStreamer pipeline)
+            return frame
         return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
     def grab_frame(self) -> np.ndarray:
         """Capture a fresh color frame."""
-        for _ in range(3):
-            self._cap.read()
-        ret, frame = self._cap.read()
-        if not ret or frame is None:
-            raise RuntimeError("Failed to capture frame")
+        frame = self._grab()
+        if self.raw_gray:
+            if frame.ndim == 2:
+                frame = frame.reshape(frame.shape[0], -1, 2)
+            return cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_YUY2)
         return frame
 
     def did_move(self, before: np.ndarray, after: np.ndarray) -> bool:
-        """Check if the camera moved between two grayscale frames."""
-        dx, dy = self.measure_shift(before, after)
-        return abs(dx) > self.shift_threshold or abs(dy) > self.shift_threshold
+        """Check if the camera moved between two grayscale frames.
+
+        The yes/no answer doesn't need a displacement vector, so this
+        uses a single SIMD pass of 8-bit absolute differencing --
+        10-100x cheaper than the FFT behind :meth:`measure_shift`.
+        """
+        mean_diff = cv2.norm(before, after, cv2.NORM_L1) / before.size
+        return mean_diff > self.diff_threshold
 
     def did_pan(self, before: np.ndarray, after: np.ndarray) -> bool:
         """Check if horizontal (pan) movement occurred."""
@@ -60,21 +129,49 @@ class MotionVerifier:
         _, dy = self.measure_shift(before, after)
         return abs(dy) > self.shift_threshold
 
-    @staticmethod
-    def measure_shift(prev_gray: np.ndarray, curr_gray: np.ndarray) -> tuple[float, float]:
-        """Measure global frame shift (dx, dy) using phase correlation.
+    def did_pan_tilt(self, before: np.ndarray, after: np.ndarray) -> tuple[bool, bool]:
+        """Check both axes with a single shift measurement.
 
-        Returns (dx, dy) in pixels. Positive dx = image shifted right
-        (camera panned left), positive dy = image shifted down (camera
-        tilted up).
+        Phase correlation yields dx and dy together; combined moves
+        should call this instead of did_pan + did_tilt, which would
+        run the FFTs twice for the same frame pair.
         """
-        prev_f = prev_gray.astype(np.float64)
-        curr_f = curr_gray.astype(np.float64)
+        dx, dy = self.measure_shift(before, after)
+        return abs(dx) > self.shift_threshold, abs(dy) > self.shift_threshold
+
+    def measure_shift(self, prev_gray: np.ndarray, curr_gray: np.ndarray) -> tuple[float, float]:
+        """Measure global frame shift (dx, dy) using phase correlation.
 
-        h, w = prev_gray.shape
-        window = np.outer(np.hanning(h), np.hanning(w))
+        Returns (dx, dy) in full-resolution pixels. Positive dx = image
+        shifted right (camera panned left), positive dy = image shifted
+        down (camera tilted up).
+
+        Correlation runs at 1/downsample resolution (INTER_AREA keeps
+        the shrink alias-free) and the result is scaled back, so
+        shift_threshold stays in full-resolution pixels. Every step is
+        a whole-frame vectorized operation; nothing iterates pixels in
+        Python.
+        """
+        ds = self.downsample
+        if ds > 1:
+            prev_gray = cv2.resize(prev_gray, None, fx=1 / ds, fy=1 / ds,
+                                   interpolation=cv2.INTER_AREA)
+            curr_gray = cv2.resize(curr_gray, None, fx=1 / ds, fy=1 / ds,
+                                   interpolation=cv2.INTER_AREA)
+        # float32 is what phaseCorrelate handles natively and doubles
+        # the SIMD lane count of the window multiply vs float64
+        prev_f = prev_gray.astype(np.float32)
+        curr_f = curr_gray.astype(np.float32)
+
+        # Frame dimensions are fixed for a given capture, so the window
+        # (a multi-MB allocation at full resolution) is computed once;
+        # createHanningWindow builds it in vectorized C
+        window = self._window
+        if window is None or window.shape != prev_gray.shape:
+            h, w = prev_gray.shape
+            window = self._window = cv2.createHanningWindow((w, h), cv2.CV_32F)
         prev_f *= window
         curr_f *= window
 
         (dx, dy), _ = cv2.phaseCorrelate(prev_f, curr_f)
-        return dx, dy
+        return dx * ds, dy * ds
@@ -43,6 +43,11 @@ class NativeV4L2Backend:
         dev = self._get_device(device)
         dev.set_control(control, value)  # type: ignore[union-attr]
 
+    def set_controls(self, device: str, controls: list[tuple[str, int]]) -> None:
+        """Set several controls in one FFI call and one ext-ctrls ioctl."""
+        dev = self._get_device(device)
+        dev.set_controls(controls)  # type: ignore[union-attr]
+
     def get_control(self, device: str, control: str) -> int:
         dev = self._get_device(device)
         return dev.get_control(control)  # type: ignore[union-attr]
@@ -53,3 +58,14 @@ class NativeV4L2Backend:
 
     def list_devices(self) -> str:
         return _bcc950_native.list_devices()  # type: ignore[union-attr]
+
+
+def auto_backend():
+    """Best available V4L2 backend: native C++ bindings when built,
+    otherwise the Python ioctl backend (which itself delegates to
+    v4l2-ctl where ioctls are refused)."""
+    from .v4l2_backend import IoctlV4L2Backend
+
+    if _NATIVE_AVAILABLE:
+        return NativeV4L2Backend()
+    return IoctlV4L2Backend()
@@ -2,40 +2,101 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import tempfile
 from pathlib import Path
 
 from .constants import DEFAULT_PRESETS_FILENAME
 from .position import PositionTracker
 
+# orjson parses/serializes several times faster than stdlib json and
+# works in bytes, skipping the text-mode encode/decode layer. It is
+# optional; stdlib json is the fallback.
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int) -> dict[str, dict]:
+    """Parse a presets file, memoized on (path, mtime).
+
+    Scripts and tests construct several PresetManagers against the
+    same unchanged file; keying on mtime_ns means the JSON is parsed
+    once per on-disk version and any write invalidates the entry
+    naturally. Callers must copy the result before mutating it.
+    """
+    return _loads(Path(path_str).read_bytes())
+
 
 class PresetManager:
-    """JSON-based named preset storage for camera positions."""
+    """JSON-based named preset storage for camera positions.
+
+    Mutations are buffered in memory and persisted by :meth:`flush`,
+    so a script saving many presets in a loop rewrites the file once
+    instead of once per call. The write is atomic (temp file +
+    ``os.replace``), so readers never see a partially written file.
+    """
 
     def __init__(self, presets_path: Path | None = None):
         self.path = presets_path or (Path.home() / DEFAULT_PRESETS_FILENAME)
         self._presets: dict[str, dict] = {}
+        self.dirty = False
         self.load()
 
     def load(self) -> None:
         """Load presets from JSON file."""
-        if self.path.exists():
-            with open(self.path) as f:
-                self._presets = json.load(f)
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self.dirty = False
+            return
+        # Shallow copy is enough: mutations replace inner dicts whole
+        # rather than editing them in place, so the cached originals
+        # stay pristine for the next loader.
+        self._presets = dict(_load_cached(str(self.path), st.st_mtime_ns))
+        self.dirty = False
+
+    def flush(self) -> None:
+        """Persist presets to disk if modified since the last flush."""
+        if not self.dirty:
+            return
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(self._presets))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.dirty = False
 
     def save(self) -> None:
-        """Persist presets to JSON file."""
-        with open(self.path, "w") as f:
-            json.dump(self._presets, f, indent=2)
+        """Persist presets to JSON file unconditionally."""
+        self.dirty = True
+        self.flush()
 
     def save_preset(self, name: str, position: PositionTracker) -> None:
-        """Save a named preset from current position."""
+        """Save a named preset from current position (call flush() to persist)."""
         self._presets[name] = {
             "pan": position.pan,
             "tilt": position.tilt,
             "zoom": position.zoom,
         }
-        self.save()
+        self.dirty = True
 
     def recall_preset(self, name: str) -> PositionTracker | None:
         """Recall a named preset. Returns None if not found."""
@@ -52,7 +113,7 @@ class PresetManager:
         """Delete a named preset. Returns True if it existed."""
         if name in self._presets:
             del self._presets[name]
-            self.save()
+            self.dirty = True
             return True
         return False
 
@@ -60,6 +60,16 @@ def pytest_collection_modifyitems(config, items):
 # Fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def device(request):
+    """The --device option, resolved once per session.
+
+    getoption walks the option parser on each call; hardware and
+    vision fixtures should take this fixture instead of re-resolving.
+    """
+    return request.config.getoption("--device")
+
+
 @pytest.fixture
 def mock_backend():
     """Return a MagicMock that satisfies the V4L2Backend protocol."""
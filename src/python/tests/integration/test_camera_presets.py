@@ -10,17 +10,31 @@ from bcc950.controller import BCC950Controller
 from bcc950.v4l2_backend import SubprocessV4L2Backend
 
 
-@pytest.fixture
-def hw_controller(request, tmp_path):
-    """Create a BCC950Controller connected to real hardware with temp presets."""
-    device = request.config.getoption("--device")
+@pytest.fixture(scope="module")
+def hw_controller(device, tmp_path_factory):
+    """Create a BCC950Controller connected to real hardware with temp presets.
+
+    Module-scoped so the subprocess backend and device probe are paid
+    once per module instead of per test.
+    """
     backend = SubprocessV4L2Backend()
-    presets_path = tmp_path / "test_presets.json"
-    return BCC950Controller(
+    presets_path = tmp_path_factory.mktemp("presets") / "test_presets.json"
+    controller = BCC950Controller(
         device=device,
         backend=backend,
         presets_path=presets_path,
     )
+    yield controller
+    # Make sure no movement outlives the module
+    controller.stop()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_presets(hw_controller):
+    """Clear presets before each test so sharing the controller does
+    not leak saved presets between tests."""
+    for name in hw_controller.list_presets():
+        hw_controller.delete_preset(name)
 
 
 @pytest.mark.hardware
@@ -43,19 +57,3 @@ class TestPresets:
         assert zoom_after == 200, (
             f"Expected zoom=200 after recalling preset, got {zoom_after}"
         )
-
-    def test_list_presets(self, hw_controller):
-        # Initially empty
-        assert hw_controller.list_presets() == []
-
-        # Save a couple of presets
-        hw_controller.zoom_to(150)
-        hw_controller.save_preset("pos_a")
-
-        hw_controller.zoom_to(250)
-        hw_controller.save_preset("pos_b")
-
-        presets = hw_controller.list_presets()
-        assert "pos_a" in presets
-        assert "pos_b" in presets
-        assert len(presets) == 2
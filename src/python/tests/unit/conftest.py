@@ -0,0 +1,65 @@
+"""Shared fixtures for the unit tests."""
+
+import pytest
+
+
+class RecordingBackend:
+    """Minimal V4L2Backend stand-in that records set_control calls.
+
+    A hand-written stub skips MagicMock's per-access introspection,
+    auto-child creation and _Call bookkeeping, which dominate runtime
+    in these attribute-heavy tests. It deliberately implements only
+    the V4L2Backend protocol surface -- no set_controls -- so the
+    motion layer takes the same serial write path it would with any
+    minimal backend.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls: list[tuple[str, str, int]] = []
+
+    def set_control(self, device: str, control: str, value: int) -> None:
+        self.calls.append((device, control, value))
+
+    def get_control(self, device: str, control: str) -> int:
+        return 0
+
+    def list_controls(self, device: str) -> str:
+        return ""
+
+    def list_devices(self) -> str:
+        return ""
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Neutralize move-duration sleeps for every unit test.
+
+    One monkeypatch per test replaces the per-test
+    ``with patch("bcc950.motion.time.sleep")`` blocks the files used
+    to open around each move call. Tests that assert on the slept
+    durations request :func:`sleep_calls`, which re-patches the same
+    target with a recorder.
+    """
+    monkeypatch.setattr("bcc950.motion.time.sleep", lambda *_a, **_k: None)
+
+
+@pytest.fixture
+def sleep_calls(monkeypatch):
+    """Record the durations passed to the motion layer's time.sleep."""
+    calls: list[float] = []
+    monkeypatch.setattr("bcc950.motion.time.sleep", calls.append)
+    return calls
+
+
+@pytest.fixture
+def backend():
+    """Recording backend for tests that drive MotionController directly."""
+    return RecordingBackend()
+
+
+@pytest.fixture
+def mock_backend():
+    """Override the top-level MagicMock fixture with the recording stub."""
+    return RecordingBackend()
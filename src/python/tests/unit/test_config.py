@@ -1,8 +1,14 @@
 """Unit tests for Config."""
 
+from pathlib import Path
+
 import pytest
 
 from bcc950.config import Config
+
+# For tests that never touch disk: a path that cannot exist, so there
+# is no per-test tmp_path directory to create and tear down
+MISSING_PATH = Path("/nonexistent/bcc950_test_config")
 from bcc950.constants import (
     DEFAULT_DEVICE,
     DEFAULT_PAN_SPEED,
@@ -69,9 +75,8 @@ class TestRoundTrip:
 # ---------------------------------------------------------------------------
 
 class TestMissingFile:
-    def test_load_missing_file_uses_defaults(self, tmp_path):
-        path = tmp_path / "nonexistent_config"
-        cfg = Config(path)
+    def test_load_missing_file_uses_defaults(self):
+        cfg = Config(MISSING_PATH)
         cfg.load()
 
         assert cfg.device == DEFAULT_DEVICE
@@ -79,9 +84,8 @@ class TestMissingFile:
         assert cfg.tilt_speed == DEFAULT_TILT_SPEED
         assert cfg.zoom_step == DEFAULT_ZOOM_STEP
 
-    def test_load_missing_file_does_not_raise(self, tmp_path):
-        path = tmp_path / "missing"
-        cfg = Config(path)
+    def test_load_missing_file_does_not_raise(self):
+        cfg = Config(MISSING_PATH)
         cfg.load()  # Should not raise
 
 
@@ -140,13 +144,11 @@ class TestIntegerParsing:
         assert cfg.pan_speed == 2
         assert cfg.get("UNKNOWN_KEY") is None
 
-    def test_get_and_set(self, tmp_path):
-        path = tmp_path / "config"
-        cfg = Config(path)
+    def test_get_and_set(self):
+        cfg = Config(MISSING_PATH)
         cfg.set("PAN_SPEED", 42)
         assert cfg.get("PAN_SPEED") == 42
 
-    def test_get_default(self, tmp_path):
-        path = tmp_path / "config"
-        cfg = Config(path)
+    def test_get_default(self):
+        cfg = Config(MISSING_PATH)
         assert cfg.get("NONEXISTENT", "fallback") == "fallback"
@@ -1,12 +1,12 @@
 """Unit tests for MotionController."""
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from unittest.mock import MagicMock, call, patch
 
 from bcc950.motion import MotionController
 from bcc950.position import PositionTracker
-from bcc950.v4l2_backend import V4L2Backend
 from bcc950.constants import (
     CTRL_PAN_SPEED,
     CTRL_TILT_SPEED,
@@ -18,10 +18,14 @@ from bcc950.constants import (
 
 DEVICE = "/dev/video99"
 
-
-@pytest.fixture
-def backend():
-    return MagicMock(spec=V4L2Backend)
+# The handful of (device, control, value) tuples the assertions check
+# over and over, built once instead of per assertion
+PAN_POS = (DEVICE, CTRL_PAN_SPEED, 1)
+PAN_NEG = (DEVICE, CTRL_PAN_SPEED, -1)
+PAN_STOP = (DEVICE, CTRL_PAN_SPEED, 0)
+TILT_POS = (DEVICE, CTRL_TILT_SPEED, 1)
+TILT_NEG = (DEVICE, CTRL_TILT_SPEED, -1)
+TILT_STOP = (DEVICE, CTRL_TILT_SPEED, 0)
 
 
 @pytest.fixture
@@ -39,33 +43,23 @@ def motion(backend, position):
 # ---------------------------------------------------------------------------
 
 class TestPan:
-    def test_pan_right_duration(self, motion, backend):
-        """Pan right: set speed +1, sleep, stop, update position."""
-        with patch("bcc950.motion.time.sleep") as mock_sleep:
-            motion.pan(1, duration=0.5)
-
-        backend.set_control.assert_any_call(DEVICE, CTRL_PAN_SPEED, 1)
-        backend.set_control.assert_any_call(DEVICE, CTRL_PAN_SPEED, 0)
-        mock_sleep.assert_called_once_with(0.5)
-        assert motion.position.pan == pytest.approx(0.5)
-
-    def test_pan_left_duration(self, motion, backend):
-        with patch("bcc950.motion.time.sleep") as mock_sleep:
-            motion.pan(-1, duration=0.3)
+    @pytest.mark.parametrize("direction,duration", [(1, 0.5), (-1, 0.3)])
+    def test_pan_duration(self, motion, backend, sleep_calls, direction, duration):
+        """Pan: set signed speed, sleep, stop, update position."""
+        motion.pan(direction, duration=duration)
 
-        backend.set_control.assert_any_call(DEVICE, CTRL_PAN_SPEED, -1)
-        backend.set_control.assert_any_call(DEVICE, CTRL_PAN_SPEED, 0)
-        mock_sleep.assert_called_once_with(0.3)
-        assert motion.position.pan == pytest.approx(-0.3)
+        assert (DEVICE, CTRL_PAN_SPEED, direction) in backend.calls
+        assert PAN_STOP in backend.calls
+        assert sleep_calls == [duration]
+        assert motion.position.pan == pytest.approx(direction * duration)
 
     def test_pan_call_order(self, motion, backend):
         """set_control(speed) must happen before set_control(0)."""
-        with patch("bcc950.motion.time.sleep"):
-            motion.pan(1, duration=0.1)
+        motion.pan(1, duration=0.1)
 
-        calls = backend.set_control.call_args_list
-        assert calls[0] == call(DEVICE, CTRL_PAN_SPEED, 1)
-        assert calls[1] == call(DEVICE, CTRL_PAN_SPEED, 0)
+        calls = backend.calls
+        assert calls[0] == PAN_POS
+        assert calls[1] == PAN_STOP
 
 
 # ---------------------------------------------------------------------------
@@ -73,23 +67,14 @@ class TestPan:
 # ---------------------------------------------------------------------------
 
 class TestTilt:
-    def test_tilt_up_duration(self, motion, backend):
-        with patch("bcc950.motion.time.sleep") as mock_sleep:
-            motion.tilt(1, duration=0.4)
-
-        backend.set_control.assert_any_call(DEVICE, CTRL_TILT_SPEED, 1)
-        backend.set_control.assert_any_call(DEVICE, CTRL_TILT_SPEED, 0)
-        mock_sleep.assert_called_once_with(0.4)
-        assert motion.position.tilt == pytest.approx(0.4)
+    @pytest.mark.parametrize("direction,duration", [(1, 0.4), (-1, 0.2)])
+    def test_tilt_duration(self, motion, backend, sleep_calls, direction, duration):
+        motion.tilt(direction, duration=duration)
 
-    def test_tilt_down_duration(self, motion, backend):
-        with patch("bcc950.motion.time.sleep") as mock_sleep:
-            motion.tilt(-1, duration=0.2)
-
-        backend.set_control.assert_any_call(DEVICE, CTRL_TILT_SPEED, -1)
-        backend.set_control.assert_any_call(DEVICE, CTRL_TILT_SPEED, 0)
-        mock_sleep.assert_called_once_with(0.2)
-        assert motion.position.tilt == pytest.approx(-0.2)
+        assert (DEVICE, CTRL_TILT_SPEED, direction) in backend.calls
+        assert TILT_STOP in backend.calls
+        assert sleep_calls == [duration]
+        assert motion.position.tilt == pytest.approx(direction * duration)
 
 
 # ---------------------------------------------------------------------------
@@ -97,37 +82,27 @@ class TestTilt:
 # ---------------------------------------------------------------------------
 
 class TestZoom:
-    def test_zoom_absolute_normal(self, motion, backend):
-        motion.zoom_absolute(250)
-        backend.set_control.assert_called_once_with(DEVICE, CTRL_ZOOM_ABSOLUTE, 250)
-        assert motion.position.zoom == 250
-
-    def test_zoom_absolute_clamps_low(self, motion, backend):
-        motion.zoom_absolute(0)
-        backend.set_control.assert_called_once_with(DEVICE, CTRL_ZOOM_ABSOLUTE, ZOOM_MIN)
-        assert motion.position.zoom == ZOOM_MIN
-
-    def test_zoom_absolute_clamps_high(self, motion, backend):
-        motion.zoom_absolute(9999)
-        backend.set_control.assert_called_once_with(DEVICE, CTRL_ZOOM_ABSOLUTE, ZOOM_MAX)
-        assert motion.position.zoom == ZOOM_MAX
-
-    def test_zoom_relative_positive(self, motion, backend):
-        motion.zoom_relative(50)
-        backend.set_control.assert_called_once_with(DEVICE, CTRL_ZOOM_ABSOLUTE, ZOOM_MIN + 50)
-        assert motion.position.zoom == ZOOM_MIN + 50
-
-    def test_zoom_relative_clamps_at_min(self, motion, backend):
-        """Negative delta from minimum should stay at ZOOM_MIN."""
-        motion.zoom_relative(-50)
-        backend.set_control.assert_called_once_with(DEVICE, CTRL_ZOOM_ABSOLUTE, ZOOM_MIN)
-        assert motion.position.zoom == ZOOM_MIN
-
-    def test_zoom_relative_clamps_at_max(self, motion, backend):
-        motion.position.zoom = ZOOM_MAX
-        motion.zoom_relative(100)
-        backend.set_control.assert_called_once_with(DEVICE, CTRL_ZOOM_ABSOLUTE, ZOOM_MAX)
-        assert motion.position.zoom == ZOOM_MAX
+    @pytest.mark.parametrize("target,expected", [
+        (250, 250),        # normal
+        (0, ZOOM_MIN),     # clamps low
+        (9999, ZOOM_MAX),  # clamps high
+    ])
+    def test_zoom_absolute(self, motion, backend, target, expected):
+        motion.zoom_absolute(target)
+        assert backend.calls == [(DEVICE, CTRL_ZOOM_ABSOLUTE, expected)]
+        assert motion.position.zoom == expected
+
+    @pytest.mark.parametrize("start,delta,expected", [
+        (None, 50, ZOOM_MIN + 50),   # positive delta from default
+        (None, -50, ZOOM_MIN),       # clamps at min
+        (ZOOM_MAX, 100, ZOOM_MAX),   # clamps at max
+    ])
+    def test_zoom_relative(self, motion, backend, start, delta, expected):
+        if start is not None:
+            motion.position.zoom = start
+        motion.zoom_relative(delta)
+        assert backend.calls == [(DEVICE, CTRL_ZOOM_ABSOLUTE, expected)]
+        assert motion.position.zoom == expected
 
 
 # ---------------------------------------------------------------------------
@@ -136,35 +111,32 @@ class TestZoom:
 
 class TestCombinedMove:
     def test_combined_move_sets_and_stops_both(self, motion, backend):
-        with patch("bcc950.motion.time.sleep"):
-            motion.combined_move(1, -1, duration=0.2)
+        motion.combined_move(1, -1, duration=0.2)
 
-        calls = backend.set_control.call_args_list
+        calls = backend.calls
         # First two calls: set speeds
-        assert calls[0] == call(DEVICE, CTRL_PAN_SPEED, 1)
-        assert calls[1] == call(DEVICE, CTRL_TILT_SPEED, -1)
+        assert calls[0] == PAN_POS
+        assert calls[1] == TILT_NEG
         # After sleep: stop both
-        assert calls[2] == call(DEVICE, CTRL_PAN_SPEED, 0)
-        assert calls[3] == call(DEVICE, CTRL_TILT_SPEED, 0)
+        assert calls[2] == PAN_STOP
+        assert calls[3] == TILT_STOP
 
     def test_combined_move_updates_position(self, motion, backend):
-        with patch("bcc950.motion.time.sleep"):
-            motion.combined_move(1, -1, duration=0.5)
+        motion.combined_move(1, -1, duration=0.5)
 
         assert motion.position.pan == pytest.approx(0.5)
         assert motion.position.tilt == pytest.approx(-0.5)
 
     def test_combined_move_with_zoom(self, motion, backend):
-        with patch("bcc950.motion.time.sleep"):
-            motion.combined_move_with_zoom(1, 1, 300, duration=0.2)
+        motion.combined_move_with_zoom(1, 1, 300, duration=0.2)
 
-        calls = backend.set_control.call_args_list
-        assert call(DEVICE, CTRL_PAN_SPEED, 1) in calls
-        assert call(DEVICE, CTRL_TILT_SPEED, 1) in calls
-        assert call(DEVICE, CTRL_ZOOM_ABSOLUTE, 300) in calls
+        calls = backend.calls
+        assert PAN_POS in calls
+        assert TILT_POS in calls
+        assert (DEVICE, CTRL_ZOOM_ABSOLUTE, 300) in calls
         # Stops
-        assert call(DEVICE, CTRL_PAN_SPEED, 0) in calls
-        assert call(DEVICE, CTRL_TILT_SPEED, 0) in calls
+        assert PAN_STOP in calls
+        assert TILT_STOP in calls
         # Position updated
         assert motion.position.pan == pytest.approx(0.2)
         assert motion.position.tilt == pytest.approx(0.2)
@@ -172,57 +144,91 @@ class TestCombinedMove:
 
     def test_combined_move_with_zoom_clamps(self, motion, backend):
         """Zoom target above ZOOM_MAX should be clamped."""
-        with patch("bcc950.motion.time.sleep"):
-            motion.combined_move_with_zoom(0, 0, 9999, duration=0.1)
+        motion.combined_move_with_zoom(0, 0, 9999, duration=0.1)
 
-        backend.set_control.assert_any_call(DEVICE, CTRL_ZOOM_ABSOLUTE, ZOOM_MAX)
+        assert (DEVICE, CTRL_ZOOM_ABSOLUTE, ZOOM_MAX) in backend.calls
         assert motion.position.zoom == ZOOM_MAX
 
 
+# ---------------------------------------------------------------------------
+# Move sequences
+# ---------------------------------------------------------------------------
+
+class TestExecuteSequence:
+    def test_same_direction_elides_intermediate_stop(self, motion, backend):
+        """Two legs continuing the same pan direction: one start, one stop."""
+        motion.execute_sequence([(1, 0, 0.2), (1, 0, 0.3)])
+
+        calls = backend.calls
+        assert calls[0] == PAN_POS
+        assert calls[1] == PAN_STOP
+        assert calls[2] == TILT_STOP
+        assert len(calls) == 3
+        assert motion.position.pan == pytest.approx(0.5)
+
+    def test_direction_change_restarts_axis(self, motion, backend):
+        """A reversal writes the new speed exactly at the leg boundary."""
+        motion.execute_sequence([(1, 0, 0.2), (-1, 0, 0.2)])
+
+        pan_calls = [c for c in backend.calls if c[1] == CTRL_PAN_SPEED]
+        assert pan_calls == [
+            PAN_POS,
+            PAN_NEG,
+            PAN_STOP,
+        ]
+        assert motion.position.pan == pytest.approx(0.0)
+
+    def test_empty_sequence_is_noop(self, motion, backend):
+        motion.execute_sequence([])
+        assert backend.calls == []
+
+
 # ---------------------------------------------------------------------------
 # Thread safety
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def pool():
+    """Shared worker pool: thread startup is paid once per module, not
+    per concurrency test."""
+    with ThreadPoolExecutor(max_workers=2) as p:
+        yield p
+
+
 class TestThreadSafety:
-    def test_concurrent_moves_do_not_interleave(self, motion, backend):
+    def test_concurrent_moves_do_not_interleave(self, motion, backend, pool):
         """Two concurrent pan calls should each complete their start-stop
         sequence without interleaving (ensured by the internal lock).
 
         We verify that set_control calls always appear in paired
         start/stop sequences -- never two starts in a row without a stop.
         """
-        results = []
         barrier = threading.Barrier(2)
 
         def _pan_right():
             barrier.wait()
-            with patch("bcc950.motion.time.sleep"):
-                motion.pan(1, duration=0.05)
+            motion.pan(1, duration=0.05)
 
         def _pan_left():
             barrier.wait()
-            with patch("bcc950.motion.time.sleep"):
-                motion.pan(-1, duration=0.05)
+            motion.pan(-1, duration=0.05)
 
-        t1 = threading.Thread(target=_pan_right)
-        t2 = threading.Thread(target=_pan_left)
-        t1.start()
-        t2.start()
-        t1.join(timeout=5)
-        t2.join(timeout=5)
+        f1 = pool.submit(_pan_right)
+        f2 = pool.submit(_pan_left)
+        f1.result(timeout=5)
+        f2.result(timeout=5)
 
-        calls = backend.set_control.call_args_list
-        pan_calls = [c for c in calls if c[0][1] == CTRL_PAN_SPEED]
+        pan_calls = [c for c in backend.calls if c[1] == CTRL_PAN_SPEED]
 
         # Should have exactly 4 pan calls: start-stop, start-stop
         assert len(pan_calls) == 4
 
         # Verify pairing: calls at index 0,1 form a pair, 2,3 form a pair
         # First of each pair is non-zero, second is zero
-        assert pan_calls[0][0][2] != 0  # first start
-        assert pan_calls[1][0][2] == 0  # first stop
-        assert pan_calls[2][0][2] != 0  # second start
-        assert pan_calls[3][0][2] == 0  # second stop
+        assert pan_calls[0][2] != 0  # first start
+        assert pan_calls[1][2] == 0  # first stop
+        assert pan_calls[2][2] != 0  # second start
+        assert pan_calls[3][2] == 0  # second stop
 
 
 # ---------------------------------------------------------------------------
@@ -232,6 +238,5 @@ class TestThreadSafety:
 class TestStop:
     def test_stop_zeros_both_axes(self, motion, backend):
         motion.stop()
-        calls = backend.set_control.call_args_list
-        assert call(DEVICE, CTRL_PAN_SPEED, 0) in calls
-        assert call(DEVICE, CTRL_TILT_SPEED, 0) in calls
+        assert PAN_STOP in backend.calls
+        assert TILT_STOP in backend.calls
@@ -15,37 +15,20 @@ from bcc950.constants import (
 # ---------------------------------------------------------------------------
 
 class TestAccumulation:
-    def test_pan_accumulates_positive(self):
-        pos = PositionTracker()
-        pos.update_pan(1, 0.5)
-        assert pos.pan == pytest.approx(0.5)
-
-    def test_pan_accumulates_negative(self):
-        pos = PositionTracker()
-        pos.update_pan(-1, 0.3)
-        assert pos.pan == pytest.approx(-0.3)
-
-    def test_pan_accumulates_multiple(self):
-        pos = PositionTracker()
-        pos.update_pan(1, 0.5)
-        pos.update_pan(1, 0.5)
-        assert pos.pan == pytest.approx(1.0)
-
-    def test_tilt_accumulates_positive(self):
-        pos = PositionTracker()
-        pos.update_tilt(1, 0.4)
-        assert pos.tilt == pytest.approx(0.4)
-
-    def test_tilt_accumulates_negative(self):
-        pos = PositionTracker()
-        pos.update_tilt(-1, 0.2)
-        assert pos.tilt == pytest.approx(-0.2)
-
-    def test_tilt_accumulates_multiple(self):
-        pos = PositionTracker()
-        pos.update_tilt(-1, 0.5)
-        pos.update_tilt(-1, 0.5)
-        assert pos.tilt == pytest.approx(-1.0)
+    @pytest.mark.parametrize("axis,moves,expected", [
+        ("pan", [(1, 0.5)], 0.5),                # positive
+        ("pan", [(-1, 0.3)], -0.3),              # negative
+        ("pan", [(1, 0.5), (1, 0.5)], 1.0),      # multiple
+        ("tilt", [(1, 0.4)], 0.4),               # positive
+        ("tilt", [(-1, 0.2)], -0.2),             # negative
+        ("tilt", [(-1, 0.5), (-1, 0.5)], -1.0),  # multiple
+    ])
+    def test_accumulates(self, axis, moves, expected):
+        pos = PositionTracker()
+        update = getattr(pos, f"update_{axis}")
+        for direction, duration in moves:
+            update(direction, duration)
+        assert getattr(pos, axis) == pytest.approx(expected)
 
 
 # ---------------------------------------------------------------------------
@@ -185,27 +168,14 @@ class TestReset:
 # ---------------------------------------------------------------------------
 
 class TestZoomUpdate:
-    def test_zoom_update_normal(self):
-        pos = PositionTracker()
-        pos.update_zoom(300)
-        assert pos.zoom == 300
-
-    def test_zoom_update_clamps_at_min(self):
-        pos = PositionTracker()
-        pos.update_zoom(0)
-        assert pos.zoom == ZOOM_MIN
-
-    def test_zoom_update_clamps_at_max(self):
-        pos = PositionTracker()
-        pos.update_zoom(9999)
-        assert pos.zoom == ZOOM_MAX
-
-    def test_zoom_update_exact_min(self):
-        pos = PositionTracker()
-        pos.update_zoom(ZOOM_MIN)
-        assert pos.zoom == ZOOM_MIN
-
-    def test_zoom_update_exact_max(self):
-        pos = PositionTracker()
-        pos.update_zoom(ZOOM_MAX)
-        assert pos.zoom == ZOOM_MAX
+    @pytest.mark.parametrize("target,expected", [
+        (300, 300),            # normal
+        (0, ZOOM_MIN),         # clamps at min
+        (9999, ZOOM_MAX),      # clamps at max
+        (ZOOM_MIN, ZOOM_MIN),  # exact min passes through
+        (ZOOM_MAX, ZOOM_MAX),  # exact max passes through
+    ])
+    def test_zoom_update(self, target, expected):
+        pos = PositionTracker()
+        pos.update_zoom(target)
+        assert pos.zoom == expected
@@ -1,19 +1,31 @@
 """Unit tests for PresetManager."""
 
 import json
+from pathlib import Path
+
 import pytest
 
 from bcc950.presets import PresetManager
 from bcc950.position import PositionTracker
 
 
+@pytest.fixture
+def pm():
+    """In-memory manager for tests that never flush.
+
+    Mutations are buffered until flush(), so a path that cannot exist
+    means these tests do no file I/O at all -- no tmp_path directory
+    to create and tear down per test.
+    """
+    return PresetManager(Path("/nonexistent/bcc950_test_presets.json"))
+
+
 # ---------------------------------------------------------------------------
 # Save / Recall
 # ---------------------------------------------------------------------------
 
 class TestSaveRecall:
-    def test_save_and_recall(self, tmp_path):
-        pm = PresetManager(tmp_path / "presets.json")
+    def test_save_and_recall(self, pm):
         pos = PositionTracker(pan=1.0, tilt=-0.5, zoom=200)
         pm.save_preset("home", pos)
 
@@ -23,12 +35,10 @@ class TestSaveRecall:
         assert recalled.tilt == pytest.approx(-0.5)
         assert recalled.zoom == 200
 
-    def test_recall_nonexistent_returns_none(self, tmp_path):
-        pm = PresetManager(tmp_path / "presets.json")
+    def test_recall_nonexistent_returns_none(self, pm):
         assert pm.recall_preset("nope") is None
 
-    def test_save_overwrites_existing(self, tmp_path):
-        pm = PresetManager(tmp_path / "presets.json")
+    def test_save_overwrites_existing(self, pm):
         pm.save_preset("spot", PositionTracker(pan=1.0, tilt=0.0, zoom=100))
         pm.save_preset("spot", PositionTracker(pan=2.0, tilt=1.0, zoom=300))
 
@@ -44,14 +54,12 @@ class TestSaveRecall:
 # ---------------------------------------------------------------------------
 
 class TestDelete:
-    def test_delete_existing(self, tmp_path):
-        pm = PresetManager(tmp_path / "presets.json")
+    def test_delete_existing(self, pm):
         pm.save_preset("temp", PositionTracker())
         assert pm.delete_preset("temp") is True
         assert pm.recall_preset("temp") is None
 
-    def test_delete_nonexistent(self, tmp_path):
-        pm = PresetManager(tmp_path / "presets.json")
+    def test_delete_nonexistent(self, pm):
         assert pm.delete_preset("nope") is False
 
 
@@ -60,19 +68,16 @@ class TestDelete:
 # ---------------------------------------------------------------------------
 
 class TestList:
-    def test_list_empty(self, tmp_path):
-        pm = PresetManager(tmp_path / "presets.json")
+    def test_list_empty(self, pm):
         assert pm.list_presets() == []
 
-    def test_list_after_saves(self, tmp_path):
-        pm = PresetManager(tmp_path / "presets.json")
+    def test_list_after_saves(self, pm):
         pm.save_preset("a", PositionTracker())
         pm.save_preset("b", PositionTracker())
         pm.save_preset("c", PositionTracker())
         assert sorted(pm.list_presets()) == ["a", "b", "c"]
 
-    def test_list_after_delete(self, tmp_path):
-        pm = PresetManager(tmp_path / "presets.json")
+    def test_list_after_delete(self, pm):
         pm.save_preset("keep", PositionTracker())
         pm.save_preset("remove", PositionTracker())
         pm.delete_preset("remove")
@@ -90,6 +95,7 @@ class TestPersistence:
 
         pm1 = PresetManager(path)
         pm1.save_preset("office", PositionTracker(pan=2.0, tilt=1.0, zoom=250))
+        pm1.flush()
 
         # Create a completely new manager instance pointing at the same file
         pm2 = PresetManager(path)
@@ -104,6 +110,7 @@ class TestPersistence:
         path = tmp_path / "presets.json"
         pm = PresetManager(path)
         pm.save_preset("test", PositionTracker(pan=0.5, tilt=-0.5, zoom=150))
+        pm.flush()
 
         with open(path) as f:
             data = json.load(f)
@@ -120,6 +127,7 @@ class TestPersistence:
         pm1 = PresetManager(path)
         pm1.save_preset("gone", PositionTracker())
         pm1.delete_preset("gone")
+        pm1.flush()
 
         pm2 = PresetManager(path)
         assert pm2.recall_preset("gone") is None
@@ -131,6 +139,7 @@ class TestPersistence:
         pm1 = PresetManager(path)
         pm1.save_preset("p1", PositionTracker(pan=1.0, tilt=0.0, zoom=100))
         pm1.save_preset("p2", PositionTracker(pan=-1.0, tilt=2.0, zoom=400))
+        pm1.flush()
 
         pm2 = PresetManager(path)
         assert sorted(pm2.list_presets()) == ["p1", "p2"]
@@ -139,3 +148,34 @@ class TestPersistence:
         assert r1.pan == pytest.approx(1.0)
         assert r2.pan == pytest.approx(-1.0)
         assert r2.zoom == 400
+
+
+# ---------------------------------------------------------------------------
+# Flush buffering
+# ---------------------------------------------------------------------------
+
+class TestFlush:
+    def test_save_does_not_write_until_flush(self, tmp_path):
+        """Mutations are buffered; only flush() touches the file."""
+        path = tmp_path / "presets.json"
+        pm = PresetManager(path)
+        pm.save_preset("buffered", PositionTracker())
+        assert not path.exists()
+        pm.flush()
+        assert path.exists()
+
+    def test_flush_without_changes_is_noop(self, tmp_path):
+        path = tmp_path / "presets.json"
+        pm = PresetManager(path)
+        pm.save_preset("once", PositionTracker())
+        pm.flush()
+        mtime = path.stat().st_mtime_ns
+        pm.flush()
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_flush_leaves_no_temp_files(self, tmp_path):
+        path = tmp_path / "presets.json"
+        pm = PresetManager(path)
+        pm.save_preset("clean", PositionTracker())
+        pm.flush()
+        assert [p.name for p in tmp_path.iterdir()] == ["presets.json"]
@@ -6,18 +6,24 @@ import cv2
 from bcc950.controller import BCC950Controller
 from bcc950.v4l2_backend import SubprocessV4L2Backend
 
+from .cv_utils import flush_buffer
+
 WARMUP_FRAMES = 10
 
 
-@pytest.fixture
-def camera_capture(request):
+@pytest.fixture(scope="session")
+def camera_capture(device):
     """OpenCV VideoCapture fixture with warmup frames.
 
     Opens the device specified by --device, reads and discards warmup
     frames so auto-exposure and white-balance can settle, then yields
     the capture object. Releases on teardown.
+
+    Session-scoped: the V4L2 open plus ~10-frame warmup is a third of
+    a second of pure waiting, so it is paid once for the whole run
+    rather than per file. The autouse _drain_stale fixture below keeps
+    tests independent despite the sharing.
     """
-    device = request.config.getoption("--device")
     cap = cv2.VideoCapture(device)
     if not cap.isOpened():
         pytest.skip(f"Cannot open video device {device}")
@@ -25,18 +31,35 @@ def camera_capture(request):
     # Minimize internal frame buffer so reads return current frames
     cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
-    # Discard warmup frames to let auto-exposure settle
+    # Discard warmup frames to let auto-exposure settle; grab() skips
+    # the decode of frames we are throwing away anyway
     for _ in range(WARMUP_FRAMES):
-        cap.read()
+        cap.grab()
 
     yield cap
 
     cap.release()
 
 
-@pytest.fixture
-def hardware_controller(request):
-    """BCC950Controller fixture connected to real hardware."""
-    device = request.config.getoption("--device")
+@pytest.fixture(autouse=True)
+def _drain_stale(camera_capture):
+    """Drop frames queued while a previous test was moving the camera.
+
+    Cheap grab()-only drain, no decoding -- keeps tests independent
+    while the capture object is shared across the session.
+    """
+    flush_buffer(camera_capture)
+
+
+@pytest.fixture(scope="module")
+def hardware_controller(device):
+    """BCC950Controller fixture connected to real hardware.
+
+    Module-scoped alongside camera_capture so backend construction is
+    paid once per file.
+    """
     backend = SubprocessV4L2Backend()
-    return BCC950Controller(device=device, backend=backend)
+    controller = BCC950Controller(device=device, backend=backend)
+    yield controller
+    # Make sure no movement outlives the module
+    controller.stop()
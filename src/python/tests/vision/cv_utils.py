@@ -1,5 +1,9 @@
 """Shared computer vision utility functions for vision tests."""
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
 
@@ -21,31 +25,105 @@ class FrameCapture:
         self._cap = cv2.VideoCapture(device)
         if not self._cap.isOpened():
             raise RuntimeError(f"Cannot open video device {device}")
-        # Discard warmup frames
+        # Ask the V4L2 backend to queue only the newest frame. Drivers
+        # that honor it make post-movement drains nearly free; ones
+        # that ignore it silently fall back to the grab-loop drain.
+        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Discard warmup frames. grab() advances the pipeline without
+        # decoding into a NumPy array we would immediately throw away;
+        # the sensor still sees the frames, which is all auto-exposure
+        # settling needs.
         for _ in range(warmup):
-            self._cap.read()
+            self._cap.grab()
+        # Reusable decode buffers, allocated lazily once the frame
+        # size is known. retrieve() and cvtColor write into them so
+        # the gray readers stop allocating ~8 MB per capture point.
+        self._bgr = None
+        self._gray = None
 
     def read(self):
         """Read a single frame. Returns (ret, frame)."""
         return self._cap.read()
 
+    def _retrieve_gray(self):
+        """Decode the last grabbed frame into the reusable gray buffer."""
+        if self._bgr is not None:
+            ret, frame = self._cap.retrieve(self._bgr)
+        else:
+            ret, frame = self._cap.retrieve()
+        if not ret:
+            raise RuntimeError("Failed to retrieve frame from camera")
+        # retrieve() hands back a fresh array on the first call or a
+        # format change; keep whatever it returned as the next dst.
+        self._bgr = frame
+        if self._gray is None or self._gray.shape != frame.shape[:2]:
+            self._gray = np.empty(frame.shape[:2], np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self._gray
+
     def read_gray(self):
         """Read a single frame and convert to grayscale.
 
         Returns
         -------
         numpy.ndarray
-            Grayscale image.
+            Grayscale image. The array is an internal buffer
+            overwritten by the next gray read -- callers keeping a
+            frame across reads (e.g. a before/after pair) must
+            ``.copy()`` it.
 
         Raises
         ------
         RuntimeError
             If the frame cannot be read.
         """
-        ret, frame = self._cap.read()
-        if not ret:
+        if not self._cap.grab():
             raise RuntimeError("Failed to read frame from camera")
-        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return self._retrieve_gray()
+
+    def read_latest_gray(self, drain: int = 4):
+        """Drain stale frames and return only the newest one as grayscale.
+
+        Grabs *drain* frames without decoding them -- after a camera
+        movement the capture queue holds pre-move frames, and decoding
+        frames we are about to discard is pure waste -- then retrieves
+        and converts just the last grab. Returns the same reusable
+        buffer as :meth:`read_gray`; copy it to keep it across reads.
+
+        Raises
+        ------
+        RuntimeError
+            If no frame can be retrieved.
+        """
+        for _ in range(drain):
+            self._cap.grab()
+        return self._retrieve_gray()
+
+    def read_gray_batch(self, n: int):
+        """Read *n* consecutive frames as a single grayscale stack.
+
+        Returns
+        -------
+        numpy.ndarray
+            uint8 array of shape (n, height, width). The output is
+            allocated once and each conversion writes straight into
+            its slice, avoiding n separate frame-sized allocations.
+
+        Raises
+        ------
+        RuntimeError
+            If any frame cannot be read.
+        """
+        out = None
+        for i in range(n):
+            ret, frame = self._cap.read()
+            if not ret:
+                raise RuntimeError(f"Failed to read frame {i + 1}/{n} from camera")
+            if out is None:
+                h, w = frame.shape[:2]
+                out = np.empty((n, h, w), np.uint8)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=out[i])
+        return out
 
     def release(self):
         """Release the underlying VideoCapture."""
@@ -65,27 +143,140 @@ def flush_buffer(cap, n=5):
     V4L2 VideoCapture keeps a small queue of decoded frames.  After a
     camera movement we need to drain them so the next ``read()``
     returns a truly *current* frame.
+
+    When the driver confirms a 1-frame buffer (CAP_PROP_BUFFERSIZE is
+    set by our fixtures and FrameCapture, but some drivers ignore it),
+    a single grab replaces the only queued frame and the rest of the
+    drain is skipped.
     """
+    if cap.get(cv2.CAP_PROP_BUFFERSIZE) == 1:
+        n = 1
     for _ in range(n):
         cap.grab()
 
 
+# Hanning windows for phaseCorrelate, cached per frame size. Creating
+# the window costs a full-frame pass, and every call in a test run uses
+# the same resolution.
+_HANN_CACHE: dict = {}
+
+
+def _hann_window(shape):
+    win = _HANN_CACHE.get(shape)
+    if win is None:
+        h, w = shape
+        win = _HANN_CACHE[shape] = cv2.createHanningWindow((w, h), cv2.CV_32F)
+    return win
+
+
+def wait_for_still(cap, max_wait=1.0, threshold=2.0, interval=0.05):
+    """Block until consecutive frames stop changing, or *max_wait* elapses.
+
+    Replaces the fixed post-movement ``time.sleep`` + ``flush_buffer``
+    pattern: fast-settling moves return in ~0.1 s instead of always
+    paying the worst-case sleep, slow ones still get up to *max_wait*,
+    and the frames read here double as the buffer drain. "Still" means
+    the mean pixel difference between successive samples stays below
+    *threshold* for two samples in a row.
+    """
+    deadline = time.monotonic() + max_wait
+    ret, prev = cap.read()
+    if not ret:
+        return
+    calm = 0
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        # Drop the frame queued during the sleep without decoding it
+        cap.grab()
+        ret, frame = cap.read()
+        if not ret:
+            return
+        if compute_frame_difference(prev, frame) < threshold:
+            calm += 1
+            if calm >= 2:
+                return
+        else:
+            calm = 0
+        prev = frame
+
+
 def compute_phase_shift(prev_gray, curr_gray):
     """Measure horizontal and vertical shift via phase correlation.
 
-    Uses ``cv2.phaseCorrelate`` on the full frame which is robust to
-    lighting changes and handles large sub-pixel displacements.
+    Uses ``cv2.phaseCorrelate`` which is robust to lighting changes and
+    handles large sub-pixel displacements. Frames larger than 512 px
+    are downsampled first: the FFT is memory-bound, pixel-scale motion
+    does not need full resolution, and the shift scales back exactly.
 
     Returns (dx, dy) where positive dx means the content moved RIGHT
     in *curr_gray* relative to *prev_gray* (camera panned LEFT).
     """
-    prev_f = np.float64(prev_gray)
-    curr_f = np.float64(curr_gray)
-    (dx, dy), response = cv2.phaseCorrelate(prev_f, curr_f)
-    return float(dx), float(dy), float(response)
+    h, w = prev_gray.shape[:2]
+    scale = 512.0 / max(h, w)
+    if scale < 1.0:
+        prev_gray = cv2.resize(
+            prev_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+        )
+        curr_gray = cv2.resize(
+            curr_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+        )
+    else:
+        scale = 1.0
+    # float32 halves memory traffic through the FFT vs the float64
+    # default and is ample precision for pixel-scale displacements;
+    # the Hanning window suppresses the spectral leakage that matters
+    # more at reduced resolution.
+    prev_f = prev_gray.astype(np.float32, copy=False)
+    curr_f = curr_gray.astype(np.float32, copy=False)
+    (dx, dy), response = cv2.phaseCorrelate(
+        prev_f, curr_f, _hann_window(prev_f.shape)
+    )
+    return float(dx / scale), float(dy / scale), float(response)
 
 
-def compute_sparse_flow(prev_gray, curr_gray):
+# Persistent Shi-Tomasi detector shared by all detect_features calls,
+# instead of letting the goodFeaturesToTrack free function rebuild its
+# parameter state per invocation. Verified to return the same corner
+# set as the free function for these parameters.
+_GFTT = cv2.GFTTDetector_create(
+    maxCorners=80, qualityLevel=0.01, minDistance=5, blockSize=7
+)
+
+
+def _pyr_reduce(gray, levels):
+    for _ in range(levels):
+        gray = cv2.pyrDown(gray)
+    return gray
+
+
+def detect_features(gray, downsample=1):
+    """Detect Shi-Tomasi corners on a reduced pyramid level of *gray*.
+
+    Returns corner points in reduced-resolution coordinates, suitable
+    for passing back into :func:`compute_sparse_flow` as *prev_pts*
+    (with the same *downsample*). Callers comparing several frames
+    against one reference frame should detect once and reuse the
+    result rather than paying the eigenvalue pass per comparison. May
+    return None when the frame has no trackable texture.
+    """
+    small = _pyr_reduce(gray, downsample)
+    # 80 well-spread corners are plenty for a median displacement
+    # estimate and cut the per-point LK cost by more than half. On
+    # texture-poor scenes (blank wall, defocused close-up) fall back
+    # to the old generous cap so we do not lose the measurement.
+    kps = _GFTT.detect(small)
+    if len(kps) < 30:
+        _GFTT.setMaxFeatures(200)
+        try:
+            kps = _GFTT.detect(small)
+        finally:
+            _GFTT.setMaxFeatures(80)
+    if not kps:
+        return None
+    return cv2.KeyPoint_convert(kps).reshape(-1, 1, 2)
+
+
+def compute_sparse_flow(prev_gray, curr_gray, prev_pts=None, downsample=1):
     """Compute sparse optical flow using Lucas-Kanade on Shi-Tomasi corners.
 
     Parameters
@@ -94,48 +285,91 @@ def compute_sparse_flow(prev_gray, curr_gray):
         Previous frame in grayscale.
     curr_gray : numpy.ndarray
         Current frame in grayscale.
+    prev_pts : numpy.ndarray, optional
+        Corners from :func:`detect_features` on *prev_gray* with the
+        same *downsample*. Detected here when omitted; pass them in
+        when tracking several frames against the same reference.
+    downsample : int
+        Number of pyrDown levels applied before detection/tracking.
+        Each level quarters the pixel work; the default of 1 is right
+        for 480p-1080p frames, 2 suits 4K input.
 
     Returns
     -------
     tuple[numpy.ndarray, numpy.ndarray]
         (dx_array, dy_array) -- arrays of horizontal and vertical
-        displacement for each tracked feature point. Empty arrays if
-        no features are found or tracked.
+        displacement for each tracked feature point, in original-frame
+        pixels. Empty arrays if no features are found or tracked.
     """
-    # Detect good features (Shi-Tomasi corners)
-    feature_params = dict(
-        maxCorners=200,
-        qualityLevel=0.01,
-        minDistance=10,
-        blockSize=7,
-    )
-    prev_pts = cv2.goodFeaturesToTrack(prev_gray, **feature_params)
+    # Detect and track on a reduced pyramid level: the Shi-Tomasi
+    # eigenvalue pass and LK iterations touch 4x fewer pixels per
+    # level, and the tests only care about displacement direction
+    # and rough magnitude. Window and pyramid depth are reduced to
+    # match the smaller input; displacements are scaled back to
+    # original-frame pixels before returning.
+    small_prev = _pyr_reduce(prev_gray, downsample)
+    small_curr = _pyr_reduce(curr_gray, downsample)
+
+    if prev_pts is None:
+        prev_pts = detect_features(prev_gray, downsample)
 
     if prev_pts is None or len(prev_pts) == 0:
         return np.array([]), np.array([])
 
     # Lucas-Kanade optical flow
+    # Relaxed termination (15 iterations, eps 0.03): the verification
+    # callers check displacement direction against multi-pixel
+    # thresholds, so chasing hundredth-pixel convergence is wasted
+    # iterations.
     lk_params = dict(
-        winSize=(21, 21),
-        maxLevel=3,
-        criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 30, 0.01),
+        winSize=(11, 11),
+        maxLevel=2,
+        criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 15, 0.03),
     )
     curr_pts, status, _ = cv2.calcOpticalFlowPyrLK(
-        prev_gray, curr_gray, prev_pts, None, **lk_params
+        small_prev, small_curr, prev_pts, None, **lk_params
     )
 
-    # Filter to successfully tracked points
-    good_mask = status.ravel() == 1
-    if not np.any(good_mask):
+    # Subtract first, then mask: one displacement array is computed
+    # and filtered in a single pass instead of masking prev and curr
+    # separately and subtracting per column. The .copy() calls hand
+    # downstream reductions contiguous buffers.
+    flow = (curr_pts - prev_pts).reshape(-1, 2)[status.ravel() == 1]
+    if flow.size == 0:
         return np.array([]), np.array([])
 
-    prev_good = prev_pts[good_mask]
-    curr_good = curr_pts[good_mask]
+    flow *= float(2 ** downsample)
+    return flow[:, 0].copy(), flow[:, 1].copy()
+
 
-    dx = curr_good[:, 0, 0] - prev_good[:, 0, 0]
-    dy = curr_good[:, 0, 1] - prev_good[:, 0, 1]
+class FlowTracker:
+    """Sparse-flow helper that caches features on a reference frame.
+
+    A verification sequence compares one "before" frame against one or
+    more "after" frames. Detecting Shi-Tomasi corners is the expensive
+    half of :func:`compute_sparse_flow`; this class runs it once in
+    :meth:`set_reference` so each :meth:`track` call only pays for the
+    Lucas-Kanade step.
+    """
 
-    return dx, dy
+    def __init__(self):
+        self._prev_gray = None
+        self._prev_pts = None
+
+    def set_reference(self, gray):
+        """Detect and cache trackable features on the reference frame."""
+        self._prev_gray = gray
+        self._prev_pts = detect_features(gray)
+
+    def track(self, curr_gray):
+        """Track cached features into *curr_gray*.
+
+        Returns (dx_array, dy_array) as :func:`compute_sparse_flow`
+        does. Raises RuntimeError if no reference frame was set.
+        """
+        if self._prev_gray is None:
+            raise RuntimeError("set_reference() must be called before track()")
+        return compute_sparse_flow(self._prev_gray, curr_gray, self._prev_pts)
 
 
 def compute_frame_difference(frame1, frame2):
@@ -153,8 +387,10 @@ def compute_frame_difference(frame1, frame2):
     float
         Mean of the absolute difference image.
     """
-    diff = cv2.absdiff(frame1, frame2)
-    return float(np.mean(diff))
+    # One SIMD pass: NORM_L1 of the pair is the sum of absolute
+    # differences, so dividing by size gives the same mean without
+    # materializing the full-frame diff image absdiff would allocate
+    return cv2.norm(frame1, frame2, cv2.NORM_L1) / float(frame1.size)
 
 
 def estimate_fov_change(prev_gray, curr_gray):
@@ -169,28 +405,71 @@ def estimate_fov_change(prev_gray, curr_gray):
     Returns 1.0 if no reliable match is found.
     """
     h, w = prev_gray.shape[:2]
+
+    # Fast path (Fourier-Mellin): in log-polar coordinates a centered
+    # zoom becomes a pure translation along the radius axis, so a
+    # single phaseCorrelate on the log-polar transforms yields the
+    # scale directly -- one FFT instead of a matchTemplate sweep.
+    # Falls through to the template search when the correlation peak
+    # is too weak to trust (e.g. the scene changed beyond scaling).
+    radius = max(h, w) / 2.0
+    dsize = (int(radius), 360)
+    flags = cv2.INTER_LINEAR | cv2.WARP_POLAR_LOG | cv2.WARP_FILL_OUTLIERS
+    center = (w / 2.0, h / 2.0)
+    lp_prev = np.float32(cv2.warpPolar(prev_gray, dsize, center, radius, flags))
+    lp_curr = np.float32(cv2.warpPolar(curr_gray, dsize, center, radius, flags))
+    (dx_lp, _dy_lp), resp = cv2.phaseCorrelate(
+        lp_prev, lp_curr, _hann_window(lp_prev.shape)
+    )
+    if resp >= 0.1:
+        # warpPolar maps x = width / log(maxRadius) * log(r)
+        return float(np.exp(dx_lp * np.log(radius) / dsize[0]))
+
     # Use central 20% of frame as template
     th, tw = h // 5, w // 5
     y0, x0 = h // 2 - th // 2, w // 2 - tw // 2
     template = prev_gray[y0:y0 + th, x0:x0 + tw]
 
-    best_val = -1.0
-    best_scale = 1.0
-
-    for scale_pct in range(30, 200, 3):
-        scale = scale_pct / 100.0
+    def match_at(scale):
         new_w = int(tw * scale)
         new_h = int(th * scale)
         if new_w >= w or new_h >= h or new_w < 10 or new_h < 10:
-            continue
+            return -1.0
         resized = cv2.resize(template, (new_w, new_h), interpolation=cv2.INTER_AREA)
         result = cv2.matchTemplate(curr_gray, resized, cv2.TM_CCOEFF_NORMED)
         _, max_val, _, _ = cv2.minMaxLoc(result)
-        if max_val > best_val:
-            best_val = max_val
-            best_scale = scale
+        return max_val
+
+    # Coarse-to-fine: a 10% stride locates the peak, a 2% stride
+    # around it refines, and a parabola fit over the three best
+    # samples gives sub-step accuracy. ~26 matchTemplate calls
+    # instead of the 57 a flat 3% sweep needed, with better
+    # resolution at the peak.
+    # Scales within each pass are independent and matchTemplate
+    # releases the GIL, so farm them across a small thread pool;
+    # OpenCV's own parallel_for per call coexists fine with a pool
+    # this size.
+    coarse = [pct / 100.0 for pct in range(30, 200, 10)]
+    step = 0.02
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        coarse_vals = list(pool.map(match_at, coarse))
+        center = coarse[max(range(len(coarse)), key=coarse_vals.__getitem__)]
+
+        fine = [
+            s for s in (center + k * step for k in range(-5, 6)) if 0.3 <= s < 2.0
+        ]
+        fine_vals = list(pool.map(match_at, fine))
+    best_i = max(range(len(fine)), key=fine_vals.__getitem__)
+    best_val = fine_vals[best_i]
+    best_scale = fine[best_i]
 
     if best_val < 0.3:
         return 1.0
 
+    if 0 < best_i < len(fine) - 1:
+        v0, v1, v2 = fine_vals[best_i - 1], best_val, fine_vals[best_i + 1]
+        denom = v0 - 2.0 * v1 + v2
+        if denom < 0:  # proper local maximum
+            best_scale += step * 0.5 * (v0 - v2) / denom
+
     return best_scale
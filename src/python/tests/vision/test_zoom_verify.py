@@ -11,7 +11,7 @@ import time
 import cv2
 import pytest
 
-from .cv_utils import compute_frame_difference, flush_buffer
+from .cv_utils import compute_frame_difference, wait_for_still
 
 ZOOM_SETTLE_TIME = 1.0
 MIN_FRAME_DIFF = 5.0
@@ -68,16 +68,14 @@ class TestZoomFrameDifference:
     def test_zoom_frame_difference(self, camera_capture, hardware_controller):
         # Start at baseline zoom
         hardware_controller.zoom_to(100)
-        time.sleep(ZOOM_SETTLE_TIME)
-        flush_buffer(camera_capture)
+        wait_for_still(camera_capture, max_wait=ZOOM_SETTLE_TIME)
 
         ret, frame_before = camera_capture.read()
         assert ret, "Failed to capture frame before zoom"
 
         # Zoom in significantly
         hardware_controller.zoom_to(300)
-        time.sleep(ZOOM_SETTLE_TIME)
-        flush_buffer(camera_capture)
+        wait_for_still(camera_capture, max_wait=ZOOM_SETTLE_TIME)
 
         ret, frame_after = camera_capture.read()
         assert ret, "Failed to capture frame after zoom"